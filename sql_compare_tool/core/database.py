@@ -6,6 +6,7 @@ from __future__ import annotations
 import os
 import subprocess
 from pathlib import Path
+from typing import Iterator
 
 import pyodbc
 import msal
@@ -113,6 +114,30 @@ class DatabaseConnection:
                 cursor.execute(query)
                 return cursor.fetchall()
 
+    def iter_query(self, query: str, timeout: int = 300, arraysize: int = 500) -> Iterator[tuple]:
+        """Yield result rows as they are fetched, in batches of ``arraysize``.
+
+        Unlike execute_query this never materialises the full result set,
+        so callers building their own list only make a single pass.
+        """
+        conn_str = self._conn_str()
+        if self.auth_type == "entra":
+            token = self._acquire_token()
+            conn = pyodbc.connect(conn_str, attrs_before={1256: token}, timeout=timeout, autocommit=True)
+        else:
+            conn = pyodbc.connect(conn_str, timeout=timeout, autocommit=True)
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = arraysize
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
     def _acquire_token(self) -> bytes:
         cache = msal.SerializableTokenCache()
         if self.token_cache_path.exists():
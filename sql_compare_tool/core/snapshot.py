@@ -1,28 +1,33 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import Any, Dict
 
 
 SNAPSHOT_VERSION = 1
+SNAPSHOT_BUFFER_SIZE = 1 << 22
 
 
-def save_snapshot(path: str | Path, metadata: Dict[str, Any]) -> None:
+def save_snapshot(path: str | Path, metadata: Dict[str, Any], buffer_size: int = SNAPSHOT_BUFFER_SIZE) -> None:
     """Save schema metadata to a snapshot file.
 
     The snapshot is a simple JSON document with a version header and a
     "metadata" payload so the format can evolve without breaking older
-    files.
+    files. The document is streamed through a large write buffer rather
+    than built as one string in memory.
     """
 
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
     payload = {"version": SNAPSHOT_VERSION, "metadata": metadata}
-    p.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+    with open(p, "wb", buffering=buffer_size) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, default=str)
 
 
-def load_snapshot(path: str | Path) -> Dict[str, Any]:
+def load_snapshot(path: str | Path, buffer_size: int = SNAPSHOT_BUFFER_SIZE) -> Dict[str, Any]:
     """Load schema metadata from a snapshot file.
 
     Accepts both the new wrapped format {"version": .., "metadata": ..}
@@ -30,7 +35,8 @@ def load_snapshot(path: str | Path) -> Dict[str, Any]:
     """
 
     p = Path(path)
-    data = json.loads(p.read_text(encoding="utf-8"))
+    with open(p, "rb", buffering=buffer_size) as f:
+        data = json.loads(f.read())
     if isinstance(data, dict) and "metadata" in data:
         return data["metadata"]  # type: ignore[return-value]
     # Fallback: treat the whole document as metadata
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import io
 import json
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Iterator
 
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
@@ -11,16 +18,211 @@ from core.database import DatabaseConnection
 from core.metadata_extractor import MetadataExtractor
 from core.comparator import SchemaComparator
 from core.diff_generator import DiffGenerator
-from core.script_generator import ScriptGenerator
 from core.snapshot import load_snapshot, save_snapshot
-from utils.report_generator import export_csv, export_html, export_json, export_excel, export_pdf
 from utils.project_manager import ProjectManager
-from utils.sql_parser import load_script_folder
+from utils.sql_parser import load_script_folder, script_cache_path
 from cache_manager import CacheManager
 
 
 AUTH_CHOICES = ["SQL Login", "Windows", "Entra MFA"]
+_AUTH_MAP = MappingProxyType({"SQL Login": "sql", "Windows": "windows", "Entra MFA": "entra"})
+# Older project files may store the auth label with different casing
+_AUTH_MAP_LOWER = MappingProxyType({k.lower(): v for k, v in _AUTH_MAP.items()})
 CONFIG_FILE = Path("config") / "connection_history.json"
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_INSERT_CHUNK_SIZE = 64 * 1024
+_FORMAT_CACHE_SIZE = 256
+_FILTER_DEBOUNCE_MS = 150
+# How often the Tk thread checks a background future for completion
+_FUTURE_POLL_MS = 50
+_VIEWER_WINDOW_LINES = 400
+_GRID_WINDOW_SIZE = 200
+# Deployment script lines shown on the wizard's warnings step
+_WARN_RE = re.compile(r"^[^\r\n]*(?:WARNING|NOTE:)[^\r\n]*", re.MULTILINE)
+
+# Grid status column symbols and (even, odd) row tags
+_STATUS_SYMBOL = {
+    "IDENTICAL": "=",
+    "DIFFERENT": "≠",
+    "MISSING_IN_TARGET": "→",
+    "MISSING_IN_SOURCE": "←",
+}
+_STATUS_TAGS = {status: (status, f"{status}_alt") for status in _STATUS_SYMBOL}
+
+# Widget states per source type; username/password are driven by the
+# auth type in database mode (see _AUTH_STATES).
+_SOURCE_TYPE_STATES = {
+    "database": {
+        "server_combo": "normal",
+        "database_combo": "normal",
+        "auth_menu": "normal",
+        "folder_entry": "disabled",
+        "folder_browse_btn": "disabled",
+        "test_btn": "normal",
+    },
+    "scripts folder": {
+        "server_combo": "disabled",
+        "database_combo": "disabled",
+        "auth_menu": "disabled",
+        "username_entry": "disabled",
+        "password_entry": "disabled",
+        "folder_entry": "normal",
+        "folder_browse_btn": "normal",
+        "test_btn": "disabled",
+    },
+}
+_SOURCE_TYPE_STATES["snapshot"] = _SOURCE_TYPE_STATES["scripts folder"]
+
+_AUTH_STATES = {
+    "sql login": {"username_entry": "normal", "password_entry": "normal"},
+    "windows": {"username_entry": "disabled", "password_entry": "disabled"},
+    "entra mfa": {"username_entry": "normal", "password_entry": "disabled"},
+}
+
+# Fonts are immutable in this app, so each distinct spec is created once
+# (after the Tk root exists) and shared by every widget that uses it.
+_FONTS: dict[tuple, ctk.CTkFont] = {}
+
+
+def _font(**options) -> ctk.CTkFont:
+    """Return the shared CTkFont for the given options."""
+    key = tuple(sorted(options.items()))
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = ctk.CTkFont(**options)
+    return font
+
+
+# Column fields that affect _format_column's output, in cache-key order
+_COLUMN_FIELDS = (
+    "name", "data_type", "max_length", "precision", "scale", "is_nullable",
+    "is_identity", "identity_seed", "identity_increment", "is_computed",
+    "computed_definition", "is_persisted", "is_sparse", "is_rowguidcol",
+    "collation", "default_value",
+)
+
+
+@lru_cache(maxsize=8192)
+def _format_column_cached(key: tuple) -> str:
+    """Format one column line from its _COLUMN_FIELDS values."""
+    col = {field: value for field, value in zip(_COLUMN_FIELDS, key) if value is not None}
+    dtype = col.get("data_type", "")
+    max_len = col.get("max_length")
+    prec = col.get("precision")
+    scale = col.get("scale")
+    nullable = "NULL" if col.get("is_nullable") else "NOT NULL"
+    
+    # Build type specification
+    type_spec = dtype
+    if max_len and max_len > 0 and dtype.lower() in ("varchar", "nvarchar", "char", "nchar", "varbinary", "binary"):
+        type_spec += f"({max_len if max_len != -1 else 'MAX'})"
+    elif prec and prec > 0:
+        if scale and scale > 0:
+            type_spec += f"({prec},{scale})"
+        else:
+            type_spec += f"({prec})"
+    
+    # Build column definition line
+    buf = io.StringIO()
+    buf.write(f"  {col['name']:<40} {type_spec:<25} {nullable:<10}")
+    
+    # Add special properties
+    if col.get("is_identity"):
+        buf.write(f" IDENTITY({col.get('identity_seed', 1)},{col.get('identity_increment', 1)})")
+    if col.get("is_computed"):
+        computed_def = col.get("computed_definition", "")
+        persisted = " PERSISTED" if col.get("is_persisted") else ""
+        buf.write(f" AS {computed_def}{persisted}")
+    if col.get("is_sparse"):
+        buf.write(" SPARSE")
+    if col.get("is_rowguidcol"):
+        buf.write(" ROWGUIDCOL")
+    if col.get("collation"):
+        buf.write(f" COLLATE {col['collation']}")
+    if col.get("default_value"):
+        buf.write(f" DEFAULT {col['default_value']}")
+    
+    buf.write("\n")
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _compute_side_by_side(source_def: str, target_def: str) -> tuple[tuple[str, str, str], ...]:
+    """DiffGenerator.side_by_side, memoized so reselecting an object skips the diff.
+
+    Returns a tuple so the cached result cannot be mutated by callers.
+    """
+    return tuple(DiffGenerator(source_def, target_def).side_by_side())
+
+
+def _build_viewer_diff(source_def: str, target_def: str):
+    """Diff rows, padded line-number prefixes and difference count for the viewer.
+
+    Pure Python with no Tk calls, so it can run off the Tk thread.
+    """
+    diff = _compute_side_by_side(source_def, target_def)
+    line_nums = tuple(f"{idx:5d} " for idx in range(1, len(diff) + 1))
+    diff_count = sum(1 for _, _, tag in diff if tag != "same")
+    return diff, line_nums, diff_count
+
+
+def _insert_tagged(widget, parts: list[str]) -> None:
+    """Append alternating (text, tags) pairs to a text widget in one Tk call.
+
+    CTkTextbox.insert only forwards a single pair, so the wrapped tk.Text
+    is used directly when there is one.
+    """
+    if parts:
+        getattr(widget, "_textbox", widget).insert("end", *parts)
+
+
+# FullScreenDiffViewer (left, right) pane tags per DiffGenerator tag
+_VIEWER_SIDE_TAGS = {
+    "same": ("same", "same"),
+    "add": ("same", "add"),
+    "del": ("del", "same"),
+    "chg": ("chg", "chg"),
+}
+
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+
+def _as_bool(value, default: bool = False) -> bool:
+    """Parse a boolean stored as text in a project file."""
+    if value is None:
+        return default
+    return str(value).strip().lower() in _TRUE_STRINGS
+
+
+def _compile_filter(filt: dict) -> dict:
+    """Precompute the lower-cased field and pattern used when matching a custom filter.
+
+    Private keys start with an underscore and are not saved to project files.
+    """
+    filt["_field"] = (filt.get("field") or "name").lower()
+    filt["_needle"] = str(filt.get("pattern") or "").lower()
+    return filt
+
+
+def _auth_type(choice: str) -> str:
+    """Map an auth menu label to the DatabaseConnection auth_type."""
+    auth_type = _AUTH_MAP.get(choice)
+    if auth_type is None:
+        auth_type = _AUTH_MAP_LOWER[choice.lower()]
+    return auth_type
+
+
+# Object types produced by load_script_folder that carry schema-qualified names
+_PRUNABLE_KEYS = ("tables", "views", "procedures", "functions", "triggers", "synonyms")
+
+
+def _prune_by_prefix(meta: dict, prefix: str) -> None:
+    """Drop objects whose (lower-cased) name does not start with prefix."""
+    for key in _PRUNABLE_KEYS:
+        objs = meta.get(key)
+        if isinstance(objs, dict):
+            meta[key] = {name: obj for name, obj in objs.items() if str(name).lower().startswith(prefix)}
 
 
 class ConnectionPanel(ctk.CTkFrame):
@@ -28,16 +230,14 @@ class ConnectionPanel(ctk.CTkFrame):
         super().__init__(master, fg_color="transparent")
         self.columnconfigure(1, weight=1)
 
-        header_font = ctk.CTkFont(size=18, weight="bold")
-        label_font = ctk.CTkFont(size=13)
+        header_font = _font(size=18, weight="bold")
+        label_font = _font(size=13)
 
         self.title_label = ctk.CTkLabel(self, text=title, font=header_font)
         self.title_label.grid(row=0, column=0, columnspan=2, pady=(0, 8), sticky="w")
 
         # Server dropdown with history
-        ctk.CTkLabel(self, text="Server", font=label_font).grid(row=1, column=0, sticky="e", padx=6, pady=4)
         server_frame = ctk.CTkFrame(self, fg_color="transparent")
-        server_frame.grid(row=1, column=1, sticky="ew", padx=6, pady=4)
         server_frame.grid_columnconfigure(0, weight=1)
         
         self.server_var = ctk.StringVar()
@@ -52,26 +252,16 @@ class ConnectionPanel(ctk.CTkFrame):
         ctk.CTkButton(server_frame, text="↻", width=40, command=self._refresh_databases).grid(row=0, column=1)
 
         # Database dropdown (auto-populated)
-        ctk.CTkLabel(self, text="Database", font=label_font).grid(row=2, column=0, sticky="e", padx=6, pady=4)
         self.database_var = ctk.StringVar()
         self.database_combo = ctk.CTkComboBox(self, variable=self.database_var, values=[], width=260)
-        self.database_combo.grid(row=2, column=1, sticky="ew", padx=6, pady=4)
 
-        ctk.CTkLabel(self, text="Auth type", font=label_font).grid(row=3, column=0, sticky="e", padx=6, pady=4)
         self.auth_var = ctk.StringVar(value=AUTH_CHOICES[2])  # Default to "Entra MFA"
         self.auth_menu = ctk.CTkOptionMenu(self, values=AUTH_CHOICES, variable=self.auth_var, command=self._auth_changed)
-        self.auth_menu.grid(row=3, column=1, sticky="w", padx=6, pady=4)
 
-        ctk.CTkLabel(self, text="Username", font=label_font).grid(row=4, column=0, sticky="e", padx=6, pady=4)
         self.username_entry = ctk.CTkEntry(self, width=260)
-        self.username_entry.grid(row=4, column=1, sticky="ew", padx=6, pady=4)
-
-        ctk.CTkLabel(self, text="Password", font=label_font).grid(row=5, column=0, sticky="e", padx=6, pady=4)
         self.password_entry = ctk.CTkEntry(self, width=260, show="*")
-        self.password_entry.grid(row=5, column=1, sticky="ew", padx=6, pady=4)
 
         # Source type: Database vs Scripts folder
-        ctk.CTkLabel(self, text="Source type", font=label_font).grid(row=6, column=0, sticky="e", padx=6, pady=4)
         self.source_type_var = ctk.StringVar(value="Database")
         self.source_type_menu = ctk.CTkOptionMenu(
             self,
@@ -79,7 +269,19 @@ class ConnectionPanel(ctk.CTkFrame):
             variable=self.source_type_var,
             command=self._source_type_changed,
         )
-        self.source_type_menu.grid(row=6, column=1, sticky="w", padx=6, pady=4)
+
+        # Labelled rows: (label text, widget, sticky for the widget cell)
+        fields = (
+            ("Server", server_frame, "ew"),
+            ("Database", self.database_combo, "ew"),
+            ("Auth type", self.auth_menu, "w"),
+            ("Username", self.username_entry, "ew"),
+            ("Password", self.password_entry, "ew"),
+            ("Source type", self.source_type_menu, "w"),
+        )
+        for row, (text, widget, sticky) in enumerate(fields, start=1):
+            ctk.CTkLabel(self, text=text, font=label_font).grid(row=row, column=0, sticky="e", padx=6, pady=4)
+            widget.grid(row=row, column=1, sticky=sticky, padx=6, pady=4)
 
         # Scripts folder selection row (only used when Source type = Scripts folder)
         self.folder_label = ctk.CTkLabel(self, text="Scripts folder", font=label_font)
@@ -98,6 +300,9 @@ class ConnectionPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(self, text="")
         self.status_label.grid(row=9, column=0, columnspan=2, pady=6)
 
+        # (server, auth_type, username) of the last successful database list fetch
+        self._last_db_fetch: tuple[str, str, str] | None = None
+
         self._auth_changed(self.auth_var.get())
 
     def _load_server_history(self) -> list[str]:
@@ -141,12 +346,16 @@ class ConnectionPanel(ctk.CTkFrame):
         """Called when server selection changes."""
         # Auto-refresh databases when server changes
         if choice and choice.strip() and self.source_type_var.get().lower() == "database":
-            self.after(100, self._refresh_databases)
+            self.after(100, lambda: self._refresh_databases(force=False))
+
+    def _refresh_databases(self, force: bool = True) -> None:
+        """Fetch list of databases from selected server.
 
-    def _refresh_databases(self) -> None:
-        """Fetch list of databases from selected server."""
-        server = self.server_var.get().strip()
-        if not server or self.source_type_var.get().lower() != "database":
+        With force=False the fetch is skipped when the list was already
+        loaded for the same server/auth/username.
+        """
+        server, _, auth, username, password, source_type, _ = self._snapshot()
+        if not server or source_type.lower() != "database":
             return
         
         try:
@@ -154,31 +363,40 @@ class ConnectionPanel(ctk.CTkFrame):
             self._save_server_to_history(server)
             
             # Build connection to master database
-            auth_map = {
-                "sql login": "sql",
-                "windows": "windows",
-                "entra mfa": "entra",
-            }
-            auth_type = auth_map[self.auth_var.get().lower()]
+            auth_type = _auth_type(auth)
+
+            # A SQL login without credentials can only fail after the driver
+            # timeout, so don't attempt it
+            credentials_hint = "Enter username and password to list databases."
+            if auth_type == "sql" and (not username or not password):
+                self.status_label.configure(text=credentials_hint, text_color="red")
+                return
+            # Credentials are in now; drop the stale hint but keep any test-connection result
+            if self.status_label.cget("text") == credentials_hint:
+                self.status_label.configure(text="")
+
+            fetch_key = (server, auth_type, username)
+            if not force and fetch_key == self._last_db_fetch:
+                return
             
             conn = DatabaseConnection(
                 server=server,
                 database="master",
                 auth_type=auth_type,
-                username=self.username_entry.get().strip() or None,
-                password=self.password_entry.get() if auth_type == "sql" else None,
+                username=username or None,
+                password=password if auth_type == "sql" else None,
             )
             
             # Query for databases
             query = "SELECT name FROM sys.databases WHERE state = 0 ORDER BY name"
-            result = conn.execute_query(query)
+            db_names = [row[0] for row in conn.iter_query(query)]
             
-            if result:
-                db_names = [row[0] for row in result]
+            if db_names:
+                self._last_db_fetch = fetch_key
                 self.database_combo.configure(values=db_names)
                 
                 # Auto-select first if none selected
-                if not self.database_var.get() and db_names:
+                if not self.database_var.get():
                     self.database_combo.set(db_names[0])
             else:
                 messagebox.showinfo("Databases", "No databases found or unable to retrieve list.")
@@ -186,72 +404,61 @@ class ConnectionPanel(ctk.CTkFrame):
         except Exception as e:
             messagebox.showerror("Database List", f"Failed to retrieve databases:\n{str(e)}")
 
+    def _set_state(self, widget, state: str) -> None:
+        # Skip the Tcl round-trip (and restyle) when nothing changes
+        if widget.cget("state") != state:
+            widget.configure(state=state)
+
+    def _apply_states(self, states: dict) -> None:
+        for name, state in states.items():
+            self._set_state(getattr(self, name), state)
+
     def _source_type_changed(self, choice: str) -> None:
         choice_lower = choice.lower()
-        if choice_lower == "database":
-            # Enable database fields and disable file/folder selection
-            self.server_combo.configure(state="normal")
-            self.database_combo.configure(state="normal")
-            self.auth_menu.configure(state="normal")
+        # Anything that is not a database/scripts folder is a snapshot file
+        mode = choice_lower if choice_lower in _SOURCE_TYPE_STATES else "snapshot"
+        self._apply_states(_SOURCE_TYPE_STATES[mode])
+        folder_text = "Snapshot file" if mode == "snapshot" else "Scripts folder"
+        if self.folder_label.cget("text") != folder_text:
+            self.folder_label.configure(text=folder_text)
+        if mode == "database":
+            # Username/password depend on the selected auth type
             self._auth_changed(self.auth_var.get())
-            self.folder_entry.configure(state="disabled")
-            self.folder_browse_btn.configure(state="disabled")
-            self.folder_label.configure(text="Scripts folder")
-            self.test_btn.configure(state="normal")
-        elif choice_lower == "scripts folder":
-            # Scripts folder mode: disable database-related fields
-            self.server_combo.configure(state="disabled")
-            self.database_combo.configure(state="disabled")
-            self.auth_menu.configure(state="disabled")
-            self.username_entry.configure(state="disabled")
-            self.password_entry.configure(state="disabled")
-            self.folder_entry.configure(state="normal")
-            self.folder_browse_btn.configure(state="normal")
-            self.folder_label.configure(text="Scripts folder")
-            self.test_btn.configure(state="disabled")
-        else:
-            # Snapshot mode: choose a .snp (or JSON) file
-            self.server_combo.configure(state="disabled")
-            self.database_combo.configure(state="disabled")
-            self.auth_menu.configure(state="disabled")
-            self.username_entry.configure(state="disabled")
-            self.password_entry.configure(state="disabled")
-            self.folder_entry.configure(state="normal")
-            self.folder_browse_btn.configure(state="normal")
-            self.folder_label.configure(text="Snapshot file")
-            self.test_btn.configure(state="disabled")
 
     def _auth_changed(self, choice: str) -> None:
-        choice_lower = choice.lower()
-        if choice_lower == "sql login":
-            self.username_entry.configure(state="normal")
-            self.password_entry.configure(state="normal")
-        elif choice_lower == "windows":
-            self.username_entry.configure(state="disabled")
-            self.password_entry.configure(state="disabled")
-        else:  # Entra MFA
-            self.username_entry.configure(state="normal")
-            self.password_entry.configure(state="disabled")
-
-        # In scripts-folder mode, username/password stay disabled
+        # In scripts-folder/snapshot mode, username/password stay disabled
         if self.source_type_var.get().lower() != "database":
-            self.username_entry.configure(state="disabled")
-            self.password_entry.configure(state="disabled")
+            states = _AUTH_STATES["windows"]
+        else:
+            states = _AUTH_STATES.get(choice.lower(), _AUTH_STATES["entra mfa"])
+        self._apply_states(states)
+
+    def _snapshot(self) -> tuple[str, str, str, str, str, str, str]:
+        """Read every connection field once.
 
-    def _build_conn(self) -> DatabaseConnection:
+        Returns (server, database, auth, username, password, source_type,
+        scripts_folder) with the free-text fields already stripped.
+        """
+        return (
+            self.server_var.get().strip(),
+            self.database_var.get().strip(),
+            self.auth_var.get(),
+            self.username_entry.get().strip(),
+            self.password_entry.get(),
+            self.source_type_var.get(),
+            self.folder_entry.get().strip(),
+        )
+
+    def _build_conn(self, snapshot: tuple[str, str, str, str, str, str, str] | None = None) -> DatabaseConnection:
         # Only valid when source type is Database
-        auth_map = {
-            "sql login": "sql",
-            "windows": "windows",
-            "entra mfa": "entra",
-        }
-        auth_type = auth_map[self.auth_var.get().lower()]
+        server, database, auth, username, password, _, _ = snapshot or self._snapshot()
+        auth_type = _auth_type(auth)
         return DatabaseConnection(
-            server=self.server_var.get().strip(),
-            database=self.database_var.get().strip(),
+            server=server,
+            database=database,
             auth_type=auth_type,
-            username=self.username_entry.get().strip() or None,
-            password=self.password_entry.get() if auth_type == "sql" else None,
+            username=username or None,
+            password=password if auth_type == "sql" else None,
         )
 
     def _browse_folder(self) -> None:
@@ -276,11 +483,12 @@ class ConnectionPanel(ctk.CTkFrame):
             return
 
         # Save server to history on successful test
-        server = self.server_var.get().strip()
+        snapshot = self._snapshot()
+        server = snapshot[0]
         if server:
             self._save_server_to_history(server)
 
-        conn = self._build_conn()
+        conn = self._build_conn(snapshot)
         ok, msg = conn.test_connection()
         self.status_label.configure(text=msg, text_color="green" if ok else "red")
         if ok:
@@ -289,14 +497,15 @@ class ConnectionPanel(ctk.CTkFrame):
             messagebox.showerror("Connection failed", msg)
 
     def get_params(self) -> dict:
+        server, database, auth, username, password, source_type, scripts_folder = self._snapshot()
         return {
-            "server": self.server_var.get().strip(),
-            "database": self.database_var.get().strip(),
-            "auth": self.auth_var.get(),
-            "username": self.username_entry.get().strip(),
-            "password": self.password_entry.get(),
-            "source_type": self.source_type_var.get(),
-            "scripts_folder": self.folder_entry.get().strip(),
+            "server": server,
+            "database": database,
+            "auth": auth,
+            "username": username,
+            "password": password,
+            "source_type": source_type,
+            "scripts_folder": scripts_folder,
         }
 
     def get_source_type(self) -> str:
@@ -310,6 +519,28 @@ class ConnectionPanel(ctk.CTkFrame):
 
 
 class MainWindow(ctk.CTk):
+    # Set once the shared ttk style has been configured
+    _STYLE_CONFIGURED = False
+
+    # (option key, checkbox label) for the Options and Deploy Options dialogs
+    _COMPARE_OPTS = (
+        ("ignore_users", "Ignore users"),
+        ("ignore_roles", "Ignore roles"),
+        ("ignore_schemas", "Ignore schemas"),
+        ("ignore_extended_properties", "Ignore extended properties"),
+        ("ignore_triggers", "Ignore triggers"),
+        ("ignore_indexes", "Ignore table indexes (compare & scripts)"),
+    )
+    _DEPLOY_OPTS = (
+        ("wrap_in_transaction", "Wrap deployment in a transaction"),
+        ("include_drop_phase", "Include DROP phase (objects missing in source)"),
+        ("include_table_phase", "Include tables/columns phase"),
+        ("include_constraint_phase", "Include constraints/indexes phase"),
+        ("include_programmability_phase", "Include programmability phase (views/procs/functions/triggers)"),
+        ("include_misc_phase", "Include miscellaneous phase (synonyms, etc.)"),
+        ("include_rollback_section", "Append generated rollback script section"),
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.title("SQL Compare Tool")
@@ -356,21 +587,36 @@ class MainWindow(ctk.CTk):
         self.compare_btn = ctk.CTkButton(self.setup_tab, text="Compare", command=self.compare_schemas)
         self.compare_btn.grid(row=2, column=0, columnspan=2, pady=(0, 6))
 
-        self.progress_label = ctk.CTkLabel(self.setup_tab, text="", font=ctk.CTkFont(size=11))
+        self.progress_label = ctk.CTkLabel(self.setup_tab, text="", font=_font(size=11))
         self.progress_label.grid(row=3, column=0, columnspan=2, pady=(0, 12))
 
         # Core state used across the results UI
         self._last_results = None
         self._last_source_metadata = None
         self._last_target_db = None
+        self._format_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._filter_fields_cache: dict[int, dict[str, str]] = {}
         self._tree_data = []
+        self._tree_data_by_iid: dict[str, tuple] = {}
+        # Filtered grid rows; only a window of them starting at _grid_offset
+        # is rendered in the Treeview at any time
+        self._grid_rows: list[tuple[str, dict]] = []
+        self._grid_offset = 0
+        # Rows rendered per window; grows with the visible row count
+        self._grid_window_size = _GRID_WINDOW_SIZE
+        self._grid_shift_job = None
+        # Set while a window shift re-selects the row it re-created
+        self._restoring_selection = False
         self._show_identical = ctk.BooleanVar(value=True)
         self._show_diff = ctk.BooleanVar(value=True)
         self._show_missing_tgt = ctk.BooleanVar(value=True)
         self._show_missing_src = ctk.BooleanVar(value=True)
         self._name_filter = ctk.StringVar(value="")
+        self._filter_after_id = None
         self._project_mgr = ProjectManager()
-        self._current_diff_text = ""
+        # (title, source, target) of the selected object; the copy/export
+        # text is only built from it on demand
+        self._current_diff_source: tuple[str, str, str] | None = None
         self._compare_options = {
             "ignore_users": False,
             "ignore_roles": False,
@@ -390,9 +636,23 @@ class MainWindow(ctk.CTk):
             "include_rollback_section": True,
         }
 
+        # Script preview window, created on first use and reused afterwards
+        self._script_window = None
+        self._script_text = None
+        self._script_insert_job = None
+
+        # Last generated deployment script, shared by preview and the wizard
+        self._script_cache_key = None
+        self._script_cache: str | None = None
+
         # Cache manager for storing and retrieving comparison data
         self.cache_manager = CacheManager()
 
+        # Report exports run off the Tk thread so large reports don't freeze the UI;
+        # the pool is shut down with the window in destroy()
+        self._export_pool = ThreadPoolExecutor(max_workers=2)
+        self._exports_in_flight: set[Path] = set()
+
         # --- Results tab: projects, options, exports, grid and diff ---
         self.results_tab.grid_columnconfigure(0, weight=1)
 
@@ -445,7 +705,7 @@ class MainWindow(ctk.CTk):
         self.results_summary_label = ctk.CTkLabel(
             summary_frame,
             text="Run Compare to see a summary of differences.",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(size=14, weight="bold"),
             text_color=("#2C3E50", "#ECF0F1"),
             anchor="w",
             justify="left",
@@ -463,8 +723,14 @@ class MainWindow(ctk.CTk):
         grid_container.grid_columnconfigure(0, weight=1)
 
         # Results grid takes the full space
+        self._configure_ttk_style()
         self._build_results_grid(grid_container)
 
+    def destroy(self):
+        """Release the export threads, dropping exports that have not started."""
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def compare_schemas(self) -> None:
         try:
             # Disable buttons during compare
@@ -500,20 +766,13 @@ class MainWindow(ctk.CTk):
                     if not folder:
                         raise ValueError(f"No scripts folder selected for {kind}.")
                     update_progress(f"Loading scripts for {kind} from {folder}...")
-                    meta = load_script_folder(folder)
+                    # Parsed scripts are cached in the app cache directory, one file per folder
+                    meta = load_script_folder(
+                        folder, cache_path=script_cache_path(folder, self.cache_manager.cache_dir)
+                    )
                     # Apply schema filter (if any) by pruning object names
                     if schema_filter:
-                        prefix = schema_filter.lower() + "."
-
-                        def _prune(obj_dict: dict):
-                            for name in list(obj_dict.keys()):
-                                if not str(name).lower().startswith(prefix):
-                                    obj_dict.pop(name, None)
-
-                        for key in ["tables", "views", "procedures", "functions", "triggers", "synonyms"]:
-                            d = meta.get(key)
-                            if isinstance(d, dict):
-                                _prune(d)
+                        _prune_by_prefix(meta, schema_filter.lower() + ".")
                     return meta
                 elif source_type == "snapshot":
                     snap_path = panel.get_snapshot_path()
@@ -559,6 +818,11 @@ class MainWindow(ctk.CTk):
             self._last_results = results
             self._last_source_metadata = src_meta
             self._last_target_db = self.target_panel.database_var.get().strip()
+            self._invalidate_script_cache()
+            self._format_cache.clear()
+            self._filter_fields_cache.clear()
+            # Diffs of the previous comparison's definitions are not reused
+            _compute_side_by_side.cache_clear()
 
             summary_text = (
                 f"Identical: {summary['IDENTICAL']} | "
@@ -609,36 +873,16 @@ class MainWindow(ctk.CTk):
             justify="left",
         ).grid(row=0, column=0, sticky="w", padx=4, pady=(0, 8))
 
-        ignore_users_var = ctk.BooleanVar(value=self._compare_options.get("ignore_users", False))
-        ignore_roles_var = ctk.BooleanVar(value=self._compare_options.get("ignore_roles", False))
-        ignore_schemas_var = ctk.BooleanVar(value=self._compare_options.get("ignore_schemas", False))
-        ignore_extprops_var = ctk.BooleanVar(value=self._compare_options.get("ignore_extended_properties", False))
-        ignore_triggers_var = ctk.BooleanVar(value=self._compare_options.get("ignore_triggers", False))
-        ignore_indexes_var = ctk.BooleanVar(value=self._compare_options.get("ignore_indexes", False))
-
-        row = 1
-        ctk.CTkCheckBox(frame, text="Ignore users", variable=ignore_users_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Ignore roles", variable=ignore_roles_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Ignore schemas", variable=ignore_schemas_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Ignore extended properties", variable=ignore_extprops_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Ignore triggers", variable=ignore_triggers_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Ignore table indexes (compare & scripts)", variable=ignore_indexes_var).grid(row=row, column=0, sticky="w", pady=2)
+        option_vars = {}
+        for row, (key, label) in enumerate(self._COMPARE_OPTS, start=1):
+            option_vars[key] = ctk.BooleanVar(value=self._compare_options.get(key, False))
+            ctk.CTkCheckBox(frame, text=label, variable=option_vars[key]).grid(row=row, column=0, sticky="w", pady=2)
 
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
-        btn_frame.grid(row=row + 1, column=0, sticky="e", pady=(8, 0))
+        btn_frame.grid(row=len(self._COMPARE_OPTS) + 1, column=0, sticky="e", pady=(8, 0))
 
         def on_ok() -> None:
-            self._compare_options["ignore_users"] = ignore_users_var.get()
-            self._compare_options["ignore_roles"] = ignore_roles_var.get()
-            self._compare_options["ignore_schemas"] = ignore_schemas_var.get()
-            self._compare_options["ignore_extended_properties"] = ignore_extprops_var.get()
-            self._compare_options["ignore_triggers"] = ignore_triggers_var.get()
-            self._compare_options["ignore_indexes"] = ignore_indexes_var.get()
+            self._compare_options.update({key: var.get() for key, var in option_vars.items()})
             dialog.destroy()
 
         def on_cancel() -> None:
@@ -666,40 +910,17 @@ class MainWindow(ctk.CTk):
             justify="left",
         ).grid(row=0, column=0, sticky="w", padx=4, pady=(0, 8))
 
-        wrap_tx_var = ctk.BooleanVar(value=self._deploy_options.get("wrap_in_transaction", True))
-        drop_phase_var = ctk.BooleanVar(value=self._deploy_options.get("include_drop_phase", True))
-        table_phase_var = ctk.BooleanVar(value=self._deploy_options.get("include_table_phase", True))
-        constraint_phase_var = ctk.BooleanVar(value=self._deploy_options.get("include_constraint_phase", True))
-        prog_phase_var = ctk.BooleanVar(value=self._deploy_options.get("include_programmability_phase", True))
-        misc_phase_var = ctk.BooleanVar(value=self._deploy_options.get("include_misc_phase", True))
-        rollback_var = ctk.BooleanVar(value=self._deploy_options.get("include_rollback_section", True))
-
-        row = 1
-        ctk.CTkCheckBox(frame, text="Wrap deployment in a transaction", variable=wrap_tx_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Include DROP phase (objects missing in source)", variable=drop_phase_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Include tables/columns phase", variable=table_phase_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Include constraints/indexes phase", variable=constraint_phase_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Include programmability phase (views/procs/functions/triggers)", variable=prog_phase_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Include miscellaneous phase (synonyms, etc.)", variable=misc_phase_var).grid(row=row, column=0, sticky="w", pady=2)
-        row += 1
-        ctk.CTkCheckBox(frame, text="Append generated rollback script section", variable=rollback_var).grid(row=row, column=0, sticky="w", pady=2)
+        option_vars = {}
+        for row, (key, label) in enumerate(self._DEPLOY_OPTS, start=1):
+            option_vars[key] = ctk.BooleanVar(value=self._deploy_options.get(key, True))
+            ctk.CTkCheckBox(frame, text=label, variable=option_vars[key]).grid(row=row, column=0, sticky="w", pady=2)
 
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
-        btn_frame.grid(row=row + 1, column=0, sticky="e", pady=(8, 0))
+        btn_frame.grid(row=len(self._DEPLOY_OPTS) + 1, column=0, sticky="e", pady=(8, 0))
 
         def on_ok() -> None:
-            self._deploy_options["wrap_in_transaction"] = wrap_tx_var.get()
-            self._deploy_options["include_drop_phase"] = drop_phase_var.get()
-            self._deploy_options["include_table_phase"] = table_phase_var.get()
-            self._deploy_options["include_constraint_phase"] = constraint_phase_var.get()
-            self._deploy_options["include_programmability_phase"] = prog_phase_var.get()
-            self._deploy_options["include_misc_phase"] = misc_phase_var.get()
-            self._deploy_options["include_rollback_section"] = rollback_var.get()
+            self._deploy_options.update({key: var.get() for key, var in option_vars.items()})
+            self._invalidate_script_cache()
             dialog.destroy()
 
         def on_cancel() -> None:
@@ -712,101 +933,155 @@ class MainWindow(ctk.CTk):
         if not self._last_results or not self._last_target_db or not self._last_source_metadata:
             messagebox.showinfo("Info", "Run Compare first to generate a script preview.")
             return
-        script = ScriptGenerator(
-            self._last_results,
-            self._last_source_metadata,
-            self._last_target_db,
-            deploy_options=self._deploy_options,
-        ).generate()
+        script = self._get_generated_script()
         # Show script in a separate window
         self._show_script_window(script)
     
+    def _get_generated_script(self) -> str:
+        """Generate the deployment script, reusing the last one if nothing changed."""
+        key = (
+            id(self._last_results),
+            id(self._last_source_metadata),
+            self._last_target_db,
+            tuple(sorted(self._deploy_options.items())),
+        )
+        if key != self._script_cache_key or self._script_cache is None:
+            from core.script_generator import ScriptGenerator
+
+            self._script_cache = ScriptGenerator(
+                self._last_results,
+                self._last_source_metadata,
+                self._last_target_db,
+                deploy_options=self._deploy_options,
+            ).generate()
+            self._script_cache_key = key
+        return self._script_cache
+
+    def _invalidate_script_cache(self) -> None:
+        self._script_cache_key = None
+        self._script_cache = None
+
     def _show_script_window(self, script: str):
-        """Show SQL script in a separate window."""
-        window = ctk.CTkToplevel(self)
-        window.title("Generated SQL Script")
-        window.geometry("1000x700")
-        window.transient(self)
+        """Show SQL script in a separate window.
+
+        The window is built once and hidden on close, so later previews only
+        swap the text.
+        """
+        window = self._script_window
+        if window is None or not window.winfo_exists():
+            window = ctk.CTkToplevel(self)
+            window.title("Generated SQL Script")
+            window.geometry("1000x700")
+            window.transient(self)
+
+            # Script text area
+            mono_font = _font(family="Consolas", size=10)
+            self._script_text = ctk.CTkTextbox(window, font=mono_font, wrap="none")
+            self._script_text.pack(fill="both", expand=True, padx=12, pady=12)
+
+            # Close button
+            button_frame = ctk.CTkFrame(window, fg_color="transparent")
+            button_frame.pack(fill="x", padx=12, pady=(0, 12))
+            ctk.CTkButton(button_frame, text="Close", width=100, command=self._hide_script_window).pack(side="right")
+            window.protocol("WM_DELETE_WINDOW", self._hide_script_window)
+            self._script_window = window
+        else:
+            window.deiconify()
+            window.lift()
+
+        # Large scripts are inserted in chunks so the event loop keeps running
+        if self._script_insert_job is not None:
+            self.after_cancel(self._script_insert_job)
+            self._script_insert_job = None
+        self._script_text.configure(state="normal")
+        self._script_text.delete("1.0", "end")
+        self._insert_script_chunk(script, 0)
         window.grab_set()
-        
-        # Script text area
-        mono_font = ctk.CTkFont(family="Consolas", size=10)
-        script_text = ctk.CTkTextbox(window, font=mono_font, wrap="none")
-        script_text.pack(fill="both", expand=True, padx=12, pady=12)
-        script_text.insert("1.0", script)
-        script_text.configure(state="disabled")
-        
-        # Close button
-        button_frame = ctk.CTkFrame(window, fg_color="transparent")
-        button_frame.pack(fill="x", padx=12, pady=(0, 12))
-        ctk.CTkButton(button_frame, text="Close", width=100, command=window.destroy).pack(side="right")
+
+    def _insert_script_chunk(self, script: str, pos: int) -> None:
+        end = pos + _INSERT_CHUNK_SIZE
+        self._script_text.insert("end", script[pos:end])
+        if end < len(script):
+            self._script_insert_job = self.after(1, self._insert_script_chunk, script, end)
+        else:
+            self._script_insert_job = None
+            self._script_text.configure(state="disabled")
+
+    def _hide_script_window(self) -> None:
+        self._script_window.grab_release()
+        self._script_window.withdraw()
 
     def open_deploy_wizard(self) -> None:
         if not self._last_results or not self._last_target_db or not self._last_source_metadata:
             messagebox.showinfo("Info", "Run Compare first to open the deployment wizard.")
             return
-        script = ScriptGenerator(
-            self._last_results,
-            self._last_source_metadata,
-            self._last_target_db,
-            deploy_options=self._deploy_options,
-        ).generate()
+        script = self._get_generated_script()
         DeploymentWizard(self, self._last_results, script, self._last_target_db)
 
     def export_csv_report(self) -> None:
+        from utils.report_generator import export_csv
+
         if not self._last_results:
             messagebox.showinfo("Info", "Run Compare first to export.")
             return
-        out_path = Path("exports") / "compare_results.csv"
-        try:
-            export_csv(self._last_results, out_path)
-            messagebox.showinfo("Export", f"CSV saved to {out_path}")
-        except Exception as exc:
-            messagebox.showerror("Export failed", str(exc))
+        self._submit_export(export_csv, "CSV", Path("exports") / "compare_results.csv")
 
     def export_html_report(self) -> None:
+        from utils.report_generator import export_html
+
         if not self._last_results:
             messagebox.showinfo("Info", "Run Compare first to export.")
             return
-        out_path = Path("exports") / "compare_results.html"
-        try:
-            export_html(self._last_results, out_path)
-            messagebox.showinfo("Export", f"HTML saved to {out_path}")
-        except Exception as exc:
-            messagebox.showerror("Export failed", str(exc))
+        self._submit_export(export_html, "HTML", Path("exports") / "compare_results.html")
 
     def export_json_report(self) -> None:
+        from utils.report_generator import export_json
+
         if not self._last_results:
             messagebox.showinfo("Info", "Run Compare first to export.")
             return
-        out_path = Path("exports") / "compare_results.json"
-        try:
-            export_json(self._last_results, out_path)
-            messagebox.showinfo("Export", f"JSON saved to {out_path}")
-        except Exception as exc:
-            messagebox.showerror("Export failed", str(exc))
+        self._submit_export(export_json, "JSON", Path("exports") / "compare_results.json")
 
     def export_excel_report(self) -> None:
+        from utils.report_generator import export_excel
+
         if not self._last_results:
             messagebox.showinfo("Info", "Run Compare first to export.")
             return
-        out_path = Path("exports") / "compare_results.xlsx"
-        try:
-            export_excel(self._last_results, out_path)
-            messagebox.showinfo("Export", f"Excel saved to {out_path}")
-        except Exception as exc:
-            messagebox.showerror("Export failed", str(exc))
+        self._submit_export(export_excel, "Excel", Path("exports") / "compare_results.xlsx")
 
     def export_pdf_report(self) -> None:
+        from utils.report_generator import export_pdf
+
         if not self._last_results:
             messagebox.showinfo("Info", "Run Compare first to export.")
             return
-        out_path = Path("exports") / "compare_results.pdf"
-        try:
-            export_pdf(self._last_results, out_path)
-            messagebox.showinfo("Export", f"PDF saved to {out_path}")
-        except Exception as exc:
+        self._submit_export(export_pdf, "PDF", Path("exports") / "compare_results.pdf")
+
+    def _submit_export(self, export_fn, label: str, out_path: Path) -> None:
+        """Run export_fn on the export pool and report back on the Tk thread."""
+        if out_path in self._exports_in_flight:
+            messagebox.showinfo("Export", f"{label} export to {out_path} is already running.")
+            return
+        self._exports_in_flight.add(out_path)
+        # Bind the current results now; a new Compare may replace them
+        future = self._export_pool.submit(export_fn, self._last_results, out_path)
+        self.after(_FUTURE_POLL_MS, self._poll_export, future, label, out_path)
+
+    def _poll_export(self, future, label: str, out_path: Path) -> None:
+        # Checked from the Tk thread; a done-callback would run on the pool thread
+        if not future.done():
+            self.after(_FUTURE_POLL_MS, self._poll_export, future, label, out_path)
+            return
+        self._on_export_done(future, label, out_path)
+
+    def _on_export_done(self, future, label: str, out_path: Path) -> None:
+        self._exports_in_flight.discard(out_path)
+        exc = future.exception()
+        if exc is not None:
             messagebox.showerror("Export failed", str(exc))
+        else:
+            messagebox.showinfo("Export", f"{label} saved to {out_path}")
 
     def save_source_snapshot(self) -> None:
         """Save the last source metadata snapshot to a .snp file.
@@ -868,13 +1143,15 @@ class MainWindow(ctk.CTk):
         scrollbar.grid(row=2, column=1, sticky="ns")
 
         def refresh_tree() -> None:
-            for row in tree.get_children():
-                tree.delete(row)
-            for filt in self._custom_filters:
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            # The iid is the filter's index in self._custom_filters
+            for i, filt in enumerate(self._custom_filters):
                 mode = (filt.get("mode") or "include").lower()
                 field = (filt.get("field") or "name").lower()
                 pattern = filt.get("pattern") or ""
-                tree.insert("", "end", values=(mode.title(), field.title(), pattern))
+                tree.insert("", "end", iid=str(i), values=(mode.title(), field.title(), pattern))
 
         refresh_tree()
 
@@ -902,7 +1179,7 @@ class MainWindow(ctk.CTk):
                 return
             mode = (mode_var.get() or "include").lower()
             field = (field_var.get() or "name").lower()
-            self._custom_filters.append({"mode": mode, "field": field, "pattern": pattern})
+            self._custom_filters.append(_compile_filter({"mode": mode, "field": field, "pattern": pattern}))
             pattern_var.set("")
             refresh_tree()
             if self._last_results:
@@ -912,21 +1189,9 @@ class MainWindow(ctk.CTk):
             selected = tree.selection()
             if not selected:
                 return
-            for item_id in selected:
-                values = tree.item(item_id, "values")
-                if not values:
-                    continue
-                mode_label = str(values[0]).strip().lower()
-                field_label = str(values[1]).strip().lower()
-                pattern_text = str(values[2])
-                idx = next(
-                    (i for i, f in enumerate(self._custom_filters)
-                     if (f.get("mode") or "include").lower() == mode_label
-                     and (f.get("field") or "name").lower() == field_label
-                     and str(f.get("pattern")) == pattern_text),
-                    None,
-                )
-                if idx is not None:
+            # Pop highest indices first so the remaining ones stay valid
+            for idx in sorted((int(item_id) for item_id in selected), reverse=True):
+                if idx < len(self._custom_filters):
                     self._custom_filters.pop(idx)
             refresh_tree()
             if self._last_results:
@@ -977,8 +1242,10 @@ class MainWindow(ctk.CTk):
                 "deploy_include_programmability_phase": self._deploy_options.get("include_programmability_phase", True),
                 "deploy_include_misc_phase": self._deploy_options.get("include_misc_phase", True),
                 "deploy_include_rollback_section": self._deploy_options.get("include_rollback_section", True),
-                # Custom filters (stored as JSON string)
-                "custom_filters": json.dumps(self._custom_filters or []),
+                # Custom filters (stored as nested elements)
+                "custom_filters": [
+                    {k: v for k, v in f.items() if not k.startswith("_")} for f in self._custom_filters
+                ],
             },
         }
         file_path = filedialog.asksaveasfilename(defaultextension=".xml", filetypes=[("Project Files", "*.xml"), ("All Files", "*.*")])
@@ -1017,41 +1284,29 @@ class MainWindow(ctk.CTk):
         self.target_panel.username_entry.insert(0, tgt.get("username", ""))
 
         filters = data.get("filters", {})
-        self._show_identical.set(str(filters.get("show_identical", "True")) == "True")
-        self._show_diff.set(str(filters.get("show_diff", "True")) == "True")
-        self._show_missing_tgt.set(str(filters.get("show_missing_target", "True")) == "True")
-        self._show_missing_src.set(str(filters.get("show_missing_source", "True")) == "True")
-        self._name_filter.set(filters.get("name_contains", ""))
-
-        # Restore comparison options
-        self._compare_options["ignore_users"] = str(filters.get("ignore_users", "False")) == "True"
-        self._compare_options["ignore_roles"] = str(filters.get("ignore_roles", "False")) == "True"
-        self._compare_options["ignore_schemas"] = str(filters.get("ignore_schemas", "False")) == "True"
-        self._compare_options["ignore_extended_properties"] = str(filters.get("ignore_extended_properties", "False")) == "True"
-        self._compare_options["ignore_triggers"] = str(filters.get("ignore_triggers", "False")) == "True"
-        self._compare_options["ignore_indexes"] = str(filters.get("ignore_indexes", "False")) == "True"
-
-        # Restore deployment options
-        self._deploy_options["wrap_in_transaction"] = str(filters.get("deploy_wrap_in_transaction", "True")) == "True"
-        self._deploy_options["include_drop_phase"] = str(filters.get("deploy_include_drop_phase", "True")) == "True"
-        self._deploy_options["include_table_phase"] = str(filters.get("deploy_include_table_phase", "True")) == "True"
-        self._deploy_options["include_constraint_phase"] = str(filters.get("deploy_include_constraint_phase", "True")) == "True"
-        self._deploy_options["include_programmability_phase"] = str(filters.get("deploy_include_programmability_phase", "True")) == "True"
-        self._deploy_options["include_misc_phase"] = str(filters.get("deploy_include_misc_phase", "True")) == "True"
-        self._deploy_options["include_rollback_section"] = str(filters.get("deploy_include_rollback_section", "True")) == "True"
+        self._show_identical.set(_as_bool(filters.get("show_identical"), True))
+        self._show_diff.set(_as_bool(filters.get("show_diff"), True))
+        self._show_missing_tgt.set(_as_bool(filters.get("show_missing_target"), True))
+        self._show_missing_src.set(_as_bool(filters.get("show_missing_source"), True))
+        self._name_filter.set(filters.get("name_contains") or "")
+
+        # Restore comparison options (all default to off)
+        for key in self._compare_options:
+            self._compare_options[key] = _as_bool(filters.get(key), False)
+
+        # Restore deployment options (saved with a "deploy_" prefix, all default to on)
+        for key in self._deploy_options:
+            self._deploy_options[key] = _as_bool(filters.get(f"deploy_{key}"), True)
 
         # Restore custom filters
-        raw_custom_filters = filters.get("custom_filters")
-        if raw_custom_filters:
+        raw_custom_filters = filters.get("custom_filters") or []
+        if isinstance(raw_custom_filters, str):
+            # Version 1 project files stored the list as a JSON string
             try:
-                if isinstance(raw_custom_filters, str):
-                    self._custom_filters = json.loads(raw_custom_filters) or []
-                else:
-                    self._custom_filters = list(raw_custom_filters)  # type: ignore[arg-type]
-            except Exception:
-                self._custom_filters = []
-        else:
-            self._custom_filters = []
+                raw_custom_filters = json.loads(raw_custom_filters) or []
+            except ValueError:
+                raw_custom_filters = []
+        self._custom_filters = [_compile_filter(dict(f)) for f in raw_custom_filters]
         self._refresh_grid()
 
     def _first_diff_preview(self, results):
@@ -1070,19 +1325,37 @@ class MainWindow(ctk.CTk):
                     return DiffGenerator(source_def, target_def).side_by_side()
         return []
 
+    def _iter_current_diff_lines(self) -> Iterator[str]:
+        """Yield the copy/export text of the selected object's diff, line by line."""
+        if self._current_diff_source is None:
+            return
+        obj_title, source_def, target_def = self._current_diff_source
+        diff = _compute_side_by_side(source_def, target_def)
+        yield f"{obj_title}\n"
+        if not diff:
+            yield "No differences found (objects are identical or one is missing).\n"
+            return
+        for idx, (left, right, _) in enumerate(diff, start=1):
+            ln = f"{idx:4d}│ "
+            yield f"{ln}{left} | {ln}{right}\n"
+
+    @property
+    def current_diff_text(self) -> str:
+        return "".join(self._iter_current_diff_lines())
+
     def _copy_current_diff(self) -> None:
-        if not self._current_diff_text:
+        if self._current_diff_source is None:
             messagebox.showinfo("Copy Diff", "No diff available to copy. Run a comparison and select an object first.")
             return
         try:
             self.clipboard_clear()
-            self.clipboard_append(self._current_diff_text)
+            self.clipboard_append(self.current_diff_text)
             self.update_idletasks()
         except Exception as exc:
             messagebox.showerror("Copy Diff", str(exc))
 
     def _export_current_diff(self) -> None:
-        if not self._current_diff_text:
+        if self._current_diff_source is None:
             messagebox.showinfo("Export Diff", "No diff available to export. Run a comparison and select an object first.")
             return
         file_path = filedialog.asksaveasfilename(
@@ -1093,20 +1366,20 @@ class MainWindow(ctk.CTk):
         if not file_path:
             return
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(self._current_diff_text)
+            # Stream the lines through a large buffer so a multi-MB diff is
+            # never built as one string or encoded into one bytes object
+            with open(file_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_current_diff_lines())
             messagebox.showinfo("Export Diff", f"Diff exported to {file_path}")
         except Exception as exc:
             messagebox.showerror("Export Diff", str(exc))
 
-    def _build_results_grid(self, parent) -> None:
-        """Create the results grid (filters + tree + diff actions) inside parent.
+    @classmethod
+    def _configure_ttk_style(cls) -> None:
+        """Configure the ttk theme for ExamDiff-like appearance (once per process)."""
+        if cls._STYLE_CONFIGURED:
+            return
 
-        The parent is typically the Results tab, so this keeps the noisy
-        comparison UI separate from the connection/setup area.
-        """
-        
-        # Configure ttk style for ExamDiff-like appearance
         style = ttk.Style()
         style.theme_use('clam')  # Modern, flat theme
         
@@ -1139,6 +1412,15 @@ class MainWindow(ctk.CTk):
             foreground=[('selected', '#FFFFFF')]
         )
 
+        cls._STYLE_CONFIGURED = True
+
+    def _build_results_grid(self, parent) -> None:
+        """Create the results grid (filters + tree + diff actions) inside parent.
+
+        The parent is typically the Results tab, so this keeps the noisy
+        comparison UI separate from the connection/setup area.
+        """
+
         parent.grid_rowconfigure(1, weight=1)
         parent.grid_columnconfigure(0, weight=1)
 
@@ -1151,7 +1433,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(filter_frame, text="Name contains:").grid(row=1, column=0, sticky="e", padx=4, pady=4)
         name_entry = ctk.CTkEntry(filter_frame, textvariable=self._name_filter)
         name_entry.grid(row=1, column=1, columnspan=2, sticky="ew", padx=4, pady=4)
-        name_entry.bind("<KeyRelease>", lambda _evt: self._refresh_grid())
+        name_entry.bind("<KeyRelease>", self._on_name_filter_key)
 
         container = ctk.CTkFrame(parent)
         container.grid(row=1, column=0, sticky="nsew", padx=0, pady=(0, 0))
@@ -1184,8 +1466,11 @@ class MainWindow(ctk.CTk):
         self.tree.tag_configure("MISSING_IN_TARGET_alt", background="#C8EDD9", foreground="#27AE60")
         self.tree.tag_configure("MISSING_IN_SOURCE_alt", background="#FFD6D6", foreground="#E74C3C")
 
-        vsb = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscroll=vsb.set)
+        # Only a window of rows is rendered, so the scrollbar is driven
+        # through handlers that map it onto the full filtered row set
+        vsb = ttk.Scrollbar(container, orient="vertical", command=self._on_grid_scrollbar)
+        self._grid_vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -1196,13 +1481,15 @@ class MainWindow(ctk.CTk):
     
     def _open_fullscreen_diff(self, event=None):
         """Open full-screen ExamDiff-style diff viewer."""
+        if self._restoring_selection:
+            return
         selected = self.tree.selection()
         if not selected:
             return
         
         iid = selected[0]
         # Find the item in our stored tree data
-        match = next((entry for entry in self._tree_data if entry[0] == iid), None)
+        match = self._tree_data_by_iid.get(iid)
         if not match:
             return
         
@@ -1219,7 +1506,7 @@ class MainWindow(ctk.CTk):
         if status != "MISSING_IN_SOURCE":
             src_obj = details.get("source", {})
             if src_obj:
-                source_def = self._format_object(obj_type, src_obj)
+                source_def = self._format_object_cached(obj_type, src_obj)
             else:
                 source_def = "(no source data)"
         else:
@@ -1228,7 +1515,7 @@ class MainWindow(ctk.CTk):
         if status != "MISSING_IN_TARGET":
             tgt_obj = details.get("target", {})
             if tgt_obj:
-                target_def = self._format_object(obj_type, tgt_obj)
+                target_def = self._format_object_cached(obj_type, tgt_obj)
             else:
                 target_def = "(no target data)"
         else:
@@ -1237,82 +1524,64 @@ class MainWindow(ctk.CTk):
         # Launch full-screen diff viewer
         FullScreenDiffViewer(self, obj_type, obj_name, status, source_def, target_def)
     
+    def _format_object_cached(self, obj_type: str, obj: dict) -> str:
+        """_format_object with a small LRU keyed by object identity.
+
+        The objects live in self._last_results, and the cache is cleared
+        whenever those results are replaced, so ids stay unique.
+        """
+        key = (obj_type, id(obj))
+        text = self._format_cache.get(key)
+        if text is None:
+            text = self._format_object(obj_type, obj)
+            self._format_cache[key] = text
+            if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        else:
+            self._format_cache.move_to_end(key)
+        return text
+
     def _format_column(self, col: dict) -> str:
         """Format a single column with all its properties."""
-        dtype = col.get("data_type", "")
-        max_len = col.get("max_length")
-        prec = col.get("precision")
-        scale = col.get("scale")
-        nullable = "NULL" if col.get("is_nullable") else "NOT NULL"
+        return _format_column_cached(tuple(col.get(field) for field in _COLUMN_FIELDS))
+
+    def _format_table(self, name: str, tbl: dict) -> str:
+        """Format a table's columns, keys and indexes for the diff panes."""
+        buf = io.StringIO()
+        buf.write(f"Table: {name}\n\n")
+        buf.write("Columns:\n")
+        for col in tbl.get("columns", []):
+            buf.write(self._format_column(col))
         
-        # Build type specification
-        type_spec = dtype
-        if max_len and max_len > 0 and dtype.lower() in ("varchar", "nvarchar", "char", "nchar", "varbinary", "binary"):
-            type_spec += f"({max_len if max_len != -1 else 'MAX'})"
-        elif prec and prec > 0:
-            if scale and scale > 0:
-                type_spec += f"({prec},{scale})"
-            else:
-                type_spec += f"({prec})"
-        
-        # Build column definition line
-        line = f"  {col['name']:<40} {type_spec:<25} {nullable:<10}"
+        # Add primary keys
+        if tbl.get("primary_key"):
+            buf.write("\nPrimary Key:\n")
+            pk = tbl["primary_key"]
+            buf.write(f"  {pk.get('name', 'PK')}: {', '.join(pk.get('columns', []))}\n")
         
-        # Add special properties
-        props = []
-        if col.get("is_identity"):
-            props.append(f"IDENTITY({col.get('identity_seed', 1)},{col.get('identity_increment', 1)})")
-        if col.get("is_computed"):
-            computed_def = col.get("computed_definition", "")
-            persisted = " PERSISTED" if col.get("is_persisted") else ""
-            props.append(f"AS {computed_def}{persisted}")
-        if col.get("is_sparse"):
-            props.append("SPARSE")
-        if col.get("is_rowguidcol"):
-            props.append("ROWGUIDCOL")
-        if col.get("collation"):
-            props.append(f"COLLATE {col['collation']}")
-        if col.get("default_value"):
-            props.append(f"DEFAULT {col['default_value']}")
+        # Add foreign keys
+        if tbl.get("foreign_keys"):
+            buf.write("\nForeign Keys:\n")
+            for fk in tbl["foreign_keys"]:
+                buf.write(f"  {fk['name']}: {', '.join(fk['columns'])} -> {fk['referenced_table']}({', '.join(fk['referenced_columns'])})\n")
         
-        if props:
-            line += " " + " ".join(props)
+        # Add indexes
+        if tbl.get("indexes"):
+            buf.write("\nIndexes:\n")
+            for idx in tbl["indexes"]:
+                idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
+                unique = "UNIQUE " if idx.get("is_unique") else ""
+                cols = ', '.join(idx.get("columns", []))
+                buf.write(f"  {unique}{idx_type}: {idx['name']} ({cols})\n")
         
-        return line + "\n"
-    
+        return buf.getvalue()
+
     def _format_object(self, obj_type: str, obj: dict) -> str:
         """Format object for display in diff viewer."""
         if obj_type == "tables":
-            # Format table structure
-            lines = [f"Table: {obj.get('name', '')}\n\n"]
-            lines.append("Columns:\n")
-            for col in obj.get("columns", []):
-                dtype = col.get("data_type", "")
-                max_len = col.get("max_length")
-                prec = col.get("precision")
-                scale = col.get("scale")
-                nullable = "NULL" if str(col.get("is_nullable", "")).upper() in ("YES", "TRUE", "1") else "NOT NULL"
-                
-                type_spec = dtype
-                if max_len and max_len > 0 and dtype.lower() in ("varchar", "nvarchar", "char", "nchar", "varbinary", "binary"):
-                    type_spec += f"({max_len if max_len != -1 else 'MAX'})"
-                elif prec and prec > 0:
-                    if scale and scale > 0:
-                        type_spec += f"({prec},{scale})"
-                    else:
-                        type_spec += f"({prec})"
-                
-                lines.append(f"  {col['name']:<40} {type_spec:<20} {nullable}\n")
-            
-            # Add indexes if any
-            if obj.get("indexes"):
-                lines.append("\nIndexes:\n")
-                for idx in obj["indexes"]:
-                    idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
-                    unique = "UNIQUE " if idx.get("is_unique") else ""
-                    lines.append(f"  {unique}{idx_type}: {idx['name']}\n")
-            
-            return "".join(lines)
+            # Same layout as the selection panes; is_nullable is already a
+            # bool from MetadataExtractor
+            return self._format_table(obj.get("name", ""), obj)
         else:
             # For programmable objects, use definition field
             if isinstance(obj, dict) and "definition" in obj:
@@ -1321,249 +1590,246 @@ class MainWindow(ctk.CTk):
                 return str(obj)
 
     def _populate_grid(self, results) -> None:
+        self._last_results = results
+        # A pending re-centre would index into the rows being replaced
+        if self._grid_shift_job is not None:
+            self.after_cancel(self._grid_shift_job)
+            self._grid_shift_job = None
+        passes = self._build_filter_predicate()
+        self._grid_rows = [
+            (obj_type, item)
+            for obj_type, items in results.items()
+            for item in items
+            if passes(item)
+        ]
+        self._render_grid_window(0)
+        self.tree.yview_moveto(0.0)
+
+    def _render_grid_window(self, first: int, keep_selection: bool = False) -> None:
+        """Render at most self._grid_window_size rows of self._grid_rows, starting at first.
+
+        Only this window exists in the Treeview; the iid of each rendered row
+        is its index into self._grid_rows. With keep_selection, the selected
+        and focused rows are restored if they are still inside the window.
+        """
+        rows = self._grid_rows
+        size = self._grid_window_size
+        first = max(0, min(first, len(rows) - size))
+        last = min(first + size, len(rows))
+        selected = self.tree.selection() if keep_selection else ()
+        focused = self.tree.focus() if keep_selection else ""
         # clear
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._grid_offset = first
         self._tree_data = []
-        self._last_results = results
-        row_count = 0
-        for obj_type, items in results.items():
-            for item in items:
-                if not self._passes_filters(item):
-                    continue
-                # Alternate row colors for better readability (ExamDiff style)
-                status = item.get("status", "")
-                if row_count % 2 == 0:
-                    tag = (status,)
-                else:
-                    tag = (f"{status}_alt",)
-                
-                # Format source and target columns for side-by-side display
-                obj_name = item["name"]
-                source_display = obj_name if status != "MISSING_IN_SOURCE" else "(missing)"
-                target_display = obj_name if status != "MISSING_IN_TARGET" else "(missing)"
-                
-                # Add status indicator symbols
-                if status == "IDENTICAL":
-                    status_symbol = "="
-                elif status == "DIFFERENT":
-                    status_symbol = "≠"
-                elif status == "MISSING_IN_TARGET":
-                    status_symbol = "→"
-                elif status == "MISSING_IN_SOURCE":
-                    status_symbol = "←"
-                else:
-                    status_symbol = "?"
-                
-                iid = self.tree.insert("", "end", 
-                    values=(obj_type, source_display, "│", target_display, status_symbol), 
-                    tags=tag)
-                self._tree_data.append((iid, obj_type, item))
-                row_count += 1
+        self._tree_data_by_iid = {}
+        for row_count in range(first, last):
+            obj_type, item = rows[row_count]
+            # Alternate row colors for better readability (ExamDiff style)
+            status = item.get("status", "")
+            tags = _STATUS_TAGS.get(status) or (status, f"{status}_alt")
+            
+            # Format source and target columns for side-by-side display
+            obj_name = item["name"]
+            source_display = obj_name if status != "MISSING_IN_SOURCE" else "(missing)"
+            target_display = obj_name if status != "MISSING_IN_TARGET" else "(missing)"
+            
+            iid = self.tree.insert("", "end", iid=str(row_count),
+                values=(obj_type, source_display, "│", target_display, _STATUS_SYMBOL.get(status, "?")), 
+                tags=(tags[row_count & 1],))
+            entry = (iid, obj_type, item)
+            self._tree_data.append(entry)
+            self._tree_data_by_iid[iid] = entry
+
+        if focused in self._tree_data_by_iid:
+            self.tree.focus(focused)
+        selected = [iid for iid in selected if iid in self._tree_data_by_iid]
+        if selected:
+            # <<TreeviewSelect>> is queued, not sent; the flag is cleared on
+            # idle, after the queued event has reached _open_fullscreen_diff
+            self._restoring_selection = True
+            self.tree.selection_set(selected)
+            self.after_idle(self._end_selection_restore)
+
+    def _end_selection_restore(self) -> None:
+        self._restoring_selection = False
+
+    def _grid_view(self) -> tuple[float, float]:
+        """Return the (top, bottom) row positions currently visible, in row units."""
+        first, last = self.tree.yview()
+        rendered = len(self._tree_data)
+        return self._grid_offset + first * rendered, self._grid_offset + last * rendered
+
+    def _scroll_grid_to(self, top: float, recentre: bool = False) -> None:
+        """Show row index top at the top of the grid.
+
+        The rendered window is re-centred when the requested rows fall outside
+        it, or always when recentre is true.
+        """
+        self._grid_shift_job = None
+        total = len(self._grid_rows)
+        if not total:
+            return
+        view_top, view_bottom = self._grid_view()
+        visible = max(1.0, view_bottom - view_top)
+        top = max(0.0, min(float(top), total - visible))
+        offset = self._grid_offset
+        rendered = len(self._tree_data)
+        if recentre or not (offset <= top and top + visible <= offset + rendered):
+            # At least four screens of rows, so that after centring the view
+            # is further than the shift margin from both window edges
+            self._grid_window_size = size = max(_GRID_WINDOW_SIZE, 4 * (int(visible) + 1))
+            # Centre the new window on the requested position
+            self._render_grid_window(int(top) - (size - int(visible)) // 2, keep_selection=True)
+            offset = self._grid_offset
+            rendered = len(self._tree_data)
+        self.tree.yview_moveto((top - offset) / rendered)
+
+    def _on_grid_scrollbar(self, action: str, *args) -> None:
+        """Scrollbar command: interpret moves relative to all rows, not just the rendered ones."""
+        total = len(self._grid_rows)
+        if not total:
+            return
+        view_top, view_bottom = self._grid_view()
+        if action == "moveto":
+            top = float(args[0]) * total
+        else:
+            # "scroll", count, "units" | "pages"
+            step = max(1.0, view_bottom - view_top) if args[1] == "pages" else 1.0
+            top = view_top + int(args[0]) * step
+        self._scroll_grid_to(top)
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        """yscrollcommand for the tree: update the scrollbar for the full row set.
+
+        When the tree scrolls itself (mouse wheel, keyboard) close to either
+        edge of the rendered window, the window is shifted on idle.
+        """
+        total = len(self._grid_rows)
+        rendered = len(self._tree_data)
+        if not total or not rendered:
+            self._grid_vsb.set(0.0, 1.0)
+            return
+        offset = self._grid_offset
+        top = offset + float(first) * rendered
+        bottom = offset + float(last) * rendered
+        self._grid_vsb.set(top / total, bottom / total)
+
+        margin = rendered // 4
+        near_top = offset > 0 and top - offset < margin
+        near_bottom = offset + rendered < total and offset + rendered - bottom < margin
+        if (near_top or near_bottom) and self._grid_shift_job is None:
+            self._grid_shift_job = self.after_idle(self._scroll_grid_to, top, True)
+
+    def _on_name_filter_key(self, _event=None) -> None:
+        # Rebuild the grid only once typing pauses, not on every keystroke
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(_FILTER_DEBOUNCE_MS, self._debounced_refresh_grid)
+
+    def _debounced_refresh_grid(self) -> None:
+        self._filter_after_id = None
+        self._refresh_grid()
 
     def _refresh_grid(self) -> None:
         if self._last_results:
             self._populate_grid(self._last_results)
 
-    def _passes_filters(self, item: dict) -> bool:
-        status = item.get("status")
-        if status == "IDENTICAL" and not self._show_identical.get():
-            return False
-        if status == "DIFFERENT" and not self._show_diff.get():
-            return False
-        if status == "MISSING_IN_TARGET" and not self._show_missing_tgt.get():
-            return False
-        if status == "MISSING_IN_SOURCE" and not self._show_missing_src.get():
-            return False
+    def _filter_state(self) -> tuple[frozenset, str, list, list]:
+        """Snapshot the filter widgets once per grid rebuild.
+
+        Returns (hidden statuses, lower-cased name filter, include rules,
+        exclude rules); rules are (field, needle) pairs from _compile_filter.
+        """
+        hidden = frozenset(
+            status for status, var in (
+                ("IDENTICAL", self._show_identical),
+                ("DIFFERENT", self._show_diff),
+                ("MISSING_IN_TARGET", self._show_missing_tgt),
+                ("MISSING_IN_SOURCE", self._show_missing_src),
+            ) if not var.get()
+        )
         name_filter = self._name_filter.get().strip().lower()
-        if name_filter and name_filter not in item.get("name", "").lower():
-            return False
-        # Apply custom include/exclude filters (name/schema/type/status)
-        if self._custom_filters:
+        includes = []
+        excludes = []
+        for f in self._custom_filters:
+            if f.get("pattern"):
+                rules = excludes if (f.get("mode") or "include").lower() == "exclude" else includes
+                rules.append((f["_field"], f["_needle"]))
+        return hidden, name_filter, includes, excludes
+
+    def _build_filter_predicate(self) -> Callable[[dict], bool]:
+        """Return a predicate for grid items that only runs the active filter checks.
+
+        With every status shown and no name or custom filters this is a
+        constant True, so the common "show everything" case costs nothing.
+        """
+        hidden, name_filter, includes, excludes = self._filter_state()
+        checks = []
+        if hidden:
+            checks.append(lambda item: item.get("status") not in hidden)
+        if name_filter:
+            checks.append(lambda item: name_filter in self._filter_fields(item)["name"])
+        if includes or excludes:
+            checks.append(lambda item: self._passes_custom_filters(item, includes, excludes))
+        if not checks:
+            return lambda item: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda item: all(check(item) for check in checks)
+
+    def _filter_fields(self, item: dict) -> dict[str, str]:
+        """Lower-cased name/schema/type/status of a grid item, computed once per comparison."""
+        fields = self._filter_fields_cache.get(id(item))
+        if fields is None:
             full_name = (item.get("name") or "").lower()
-            obj_type = (item.get("type") or "").lower()  # may be empty; tree supplies type separately
-            obj_status = (item.get("status") or "").lower()
-            schema_name = ""
-            if "." in full_name:
-                schema_name = full_name.split(".", 1)[0]
-
-            def value_for_field(field: str) -> str:
-                f = field.lower()
-                if f == "schema":
-                    return schema_name
-                if f == "type":
-                    return obj_type
-                if f == "status":
-                    return obj_status
-                return full_name
-
-            includes = [
-                f for f in self._custom_filters
-                if (f.get("mode") or "include").lower() == "include" and f.get("pattern")
-            ]
-            excludes = [
-                f for f in self._custom_filters
-                if (f.get("mode") or "include").lower() == "exclude" and f.get("pattern")
-            ]
-
-            def rule_matches(rule: dict) -> bool:
-                field = (rule.get("field") or "name").lower()
-                pattern = str(rule.get("pattern", "")).lower()
-                target_val = value_for_field(field)
-                return bool(pattern) and pattern in target_val
-
-            if includes:
-                if not any(rule_matches(r) for r in includes):
-                    return False
-
-            if excludes:
-                if any(rule_matches(r) for r in excludes):
-                    return False
+            fields = self._filter_fields_cache[id(item)] = {
+                "name": full_name,
+                "schema": full_name.split(".", 1)[0] if "." in full_name else "",
+                "type": (item.get("type") or "").lower(),  # may be empty; tree supplies type separately
+                "status": (item.get("status") or "").lower(),
+            }
+        return fields
+
+    def _passes_custom_filters(self, item: dict, includes: list, excludes: list) -> bool:
+        # Apply custom include/exclude filters (name/schema/type/status);
+        # unknown fields match against the name
+        fields = self._filter_fields(item)
+        full_name = fields["name"]
+
+        if includes:
+            if not any(needle in fields.get(field, full_name) for field, needle in includes):
+                return False
+
+        if excludes:
+            if any(needle in fields.get(field, full_name) for field, needle in excludes):
+                return False
         return True
 
-    def _on_tree_select(self, event) -> None:
-        selection = self.tree.selection()
-        if not selection:
-            return
-        iid = selection[0]
-        match = next((entry for entry in self._tree_data if entry[0] == iid), None)
-        if not match:
-            return
-        _, obj_type, item = match
+    def _item_definitions(self, obj_type: str, item: dict) -> tuple[str, str]:
+        """Return the (source, target) text shown in the diff panes for a grid item."""
         details = item.get("details", {})
         source_def = ""
         target_def = ""
         if obj_type == "tables":
-            # For tables, format the structure in a readable way
-            # Handle MISSING_IN_TARGET: details contains the source object directly
+            # For tables, format the structure in a readable way.
+            # MISSING_* items carry the one existing object directly in
+            # details; IDENTICAL/DIFFERENT nest it under source/target.
             if item["status"] == "MISSING_IN_TARGET":
-                src_tbl = details
-                if src_tbl and isinstance(src_tbl, dict):
-                    lines = [f"Table: {item['name']}\n\n"]
-                    lines.append("Columns:\n")
-                    for col in src_tbl.get("columns", []):
-                        lines.append(self._format_column(col))
-                    
-                    # Add primary keys
-                    if src_tbl.get("primary_key"):
-                        lines.append("\nPrimary Key:\n")
-                        pk = src_tbl["primary_key"]
-                        lines.append(f"  {pk.get('name', 'PK')}: {', '.join(pk.get('columns', []))}\n")
-                    
-                    # Add foreign keys
-                    if src_tbl.get("foreign_keys"):
-                        lines.append("\nForeign Keys:\n")
-                        for fk in src_tbl["foreign_keys"]:
-                            lines.append(f"  {fk['name']}: {', '.join(fk['columns'])} -> {fk['referenced_table']}({', '.join(fk['referenced_columns'])})\n")
-                    
-                    # Add indexes
-                    if src_tbl.get("indexes"):
-                        lines.append("\nIndexes:\n")
-                        for idx in src_tbl["indexes"]:
-                            idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
-                            unique = "UNIQUE " if idx.get("is_unique") else ""
-                            cols = ', '.join(idx.get("columns", []))
-                            lines.append(f"  {unique}{idx_type}: {idx['name']} ({cols})\n")
-                    
-                    source_def = "".join(lines)
+                if details and isinstance(details, dict):
+                    source_def = self._format_table(item["name"], details)
                 target_def = "(missing in target)"
-            # Handle MISSING_IN_SOURCE: details contains the target object directly
             elif item["status"] == "MISSING_IN_SOURCE":
-                tgt_tbl = details
-                if tgt_tbl and isinstance(tgt_tbl, dict):
-                    lines = [f"Table: {item['name']}\n\n"]
-                    lines.append("Columns:\n")
-                    for col in tgt_tbl.get("columns", []):
-                        lines.append(self._format_column(col))
-                    
-                    # Add primary keys
-                    if tgt_tbl.get("primary_key"):
-                        lines.append("\nPrimary Key:\n")
-                        pk = tgt_tbl["primary_key"]
-                        lines.append(f"  {pk.get('name', 'PK')}: {', '.join(pk.get('columns', []))}\n")
-                    
-                    # Add foreign keys
-                    if tgt_tbl.get("foreign_keys"):
-                        lines.append("\nForeign Keys:\n")
-                        for fk in tgt_tbl["foreign_keys"]:
-                            lines.append(f"  {fk['name']}: {', '.join(fk['columns'])} -> {fk['referenced_table']}({', '.join(fk['referenced_columns'])})\n")
-                    
-                    # Add indexes
-                    if tgt_tbl.get("indexes"):
-                        lines.append("\nIndexes:\n")
-                        for idx in tgt_tbl["indexes"]:
-                            idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
-                            unique = "UNIQUE " if idx.get("is_unique") else ""
-                            cols = ', '.join(idx.get("columns", []))
-                            lines.append(f"  {unique}{idx_type}: {idx['name']} ({cols})\n")
-                    
-                    target_def = "".join(lines)
+                if details and isinstance(details, dict):
+                    target_def = self._format_table(item["name"], details)
                 source_def = "(missing in source)"
-            # Handle IDENTICAL or DIFFERENT: details has source and target nested
             else:
                 src_tbl = details.get("source", {})
-                if src_tbl:
-                    lines = [f"Table: {item['name']}\n\n"]
-                    lines.append("Columns:\n")
-                    for col in src_tbl.get("columns", []):
-                        lines.append(self._format_column(col))
-                    
-                    # Add primary keys
-                    if src_tbl.get("primary_key"):
-                        lines.append("\nPrimary Key:\n")
-                        pk = src_tbl["primary_key"]
-                        lines.append(f"  {pk.get('name', 'PK')}: {', '.join(pk.get('columns', []))}\n")
-                    
-                    # Add foreign keys
-                    if src_tbl.get("foreign_keys"):
-                        lines.append("\nForeign Keys:\n")
-                        for fk in src_tbl["foreign_keys"]:
-                            lines.append(f"  {fk['name']}: {', '.join(fk['columns'])} -> {fk['referenced_table']}({', '.join(fk['referenced_columns'])})\n")
-                    
-                    # Add indexes
-                    if src_tbl.get("indexes"):
-                        lines.append("\nIndexes:\n")
-                        for idx in src_tbl["indexes"]:
-                            idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
-                            unique = "UNIQUE " if idx.get("is_unique") else ""
-                            cols = ', '.join(idx.get("columns", []))
-                            lines.append(f"  {unique}{idx_type}: {idx['name']} ({cols})\n")
-                    
-                    source_def = "".join(lines)
-                else:
-                    source_def = "(table missing)"
-                
                 tgt_tbl = details.get("target", {})
-                if tgt_tbl:
-                    lines = [f"Table: {item['name']}\n\n"]
-                    lines.append("Columns:\n")
-                    for col in tgt_tbl.get("columns", []):
-                        lines.append(self._format_column(col))
-                    
-                    # Add primary keys
-                    if tgt_tbl.get("primary_key"):
-                        lines.append("\nPrimary Key:\n")
-                        pk = tgt_tbl["primary_key"]
-                        lines.append(f"  {pk.get('name', 'PK')}: {', '.join(pk.get('columns', []))}\n")
-                    
-                    # Add foreign keys
-                    if tgt_tbl.get("foreign_keys"):
-                        lines.append("\nForeign Keys:\n")
-                        for fk in tgt_tbl["foreign_keys"]:
-                            lines.append(f"  {fk['name']}: {', '.join(fk['columns'])} -> {fk['referenced_table']}({', '.join(fk['referenced_columns'])})\n")
-                    
-                    # Add indexes
-                    if tgt_tbl.get("indexes"):
-                        lines.append("\nIndexes:\n")
-                        for idx in tgt_tbl["indexes"]:
-                            idx_type = "CLUSTERED" if idx.get("is_clustered") else "NONCLUSTERED"
-                            unique = "UNIQUE " if idx.get("is_unique") else ""
-                            cols = ', '.join(idx.get("columns", []))
-                            lines.append(f"  {unique}{idx_type}: {idx['name']} ({cols})\n")
-                    
-                    target_def = "".join(lines)
-                else:
-                    target_def = "(table missing)"
+                source_def = self._format_table(item["name"], src_tbl) if src_tbl else "(table missing)"
+                target_def = self._format_table(item["name"], tgt_tbl) if tgt_tbl else "(table missing)"
         else:
             # For programmable objects (views/procs/functions/triggers) we
             # prefer the stored SQL definition. For other object types that
@@ -1602,7 +1868,20 @@ class MainWindow(ctk.CTk):
                 else:
                     target_def = str(tgt_obj) if tgt_obj else ""
 
-        diff = DiffGenerator(source_def, target_def).side_by_side()
+        return source_def, target_def
+
+    def _on_tree_select(self, event) -> None:
+        selection = self.tree.selection()
+        if not selection:
+            return
+        iid = selection[0]
+        match = self._tree_data_by_iid.get(iid)
+        if not match:
+            return
+        _, obj_type, item = match
+        source_def, target_def = self._item_definitions(obj_type, item)
+
+        diff = _compute_side_by_side(source_def, target_def)
 
         # Always show Diff tab when selecting an item
         try:
@@ -1627,13 +1906,12 @@ class MainWindow(ctk.CTk):
         self.sql_left_text.insert("1.0", f"{obj_title}\n{header_line}\n\n")
         self.sql_right_text.insert("1.0", f"{obj_title}\n{header_line}\n\n")
 
-        rendered_lines: list[str] = [f"{obj_title}\n"]
+        self._current_diff_source = (obj_title, source_def, target_def)
 
         if not diff:
             line = "No differences found (objects are identical or one is missing)."
             self.sql_left_text.insert("end", line)
             self.sql_right_text.insert("end", line)
-            rendered_lines.append(line + "\n")
         else:
             # Track change blocks for visual separation
             prev_tag = None
@@ -1671,12 +1949,8 @@ class MainWindow(ctk.CTk):
                 if right.strip():
                     self.sql_right_text.tag_add(right_tag, start_pos, end_pos)
 
-                rendered_lines.append(f"{left_display} | {right_display}\n")
                 prev_tag = tag
 
-        full_text = "".join(rendered_lines)
-        self._current_diff_text = full_text
-
         self.sql_left_text.configure(state="disabled")
         self.sql_right_text.configure(state="disabled")
 
@@ -1780,22 +2054,57 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         self.obj_type = obj_type
         self.obj_name = obj_name
         self.status = status
-        self.source_lines = source_def.split("\n") if source_def else ["(empty)"]
-        self.target_lines = target_def.split("\n") if target_def else ["(empty)"]
-        
-        # Calculate diff
-        self.diff_data = self._compute_diff()
-        
-        self._build_ui()
+        self.source_def = source_def or "(empty)"
+        self.target_def = target_def or "(empty)"
         
-    def _compute_diff(self):
-        """Compute line-by-line diff similar to DiffGenerator."""
-        from core.diff_generator import DiffGenerator
+        # Filled in by _on_diff_ready; only a window of it is rendered into the panes
+        self.diff_data = ()
+        # Padded line-number prefixes, formatted once and reused on every re-render
+        self._line_nums = ()
+        self._window_first = 0
+        self._window_len = 0
+        # Grows with the visible line count so a re-centred view stays clear of the shift margin
+        self._window_size = _VIEWER_WINDOW_LINES
+        self._shift_job = None
+        self._pending_sync = None
+        self._sync_job = None
         
-        source_text = "\n".join(self.source_lines)
-        target_text = "\n".join(self.target_lines)
+        # Diff large definitions in the background so the window opens at once;
+        # the pool is shut down with the window in destroy()
+        self._diff_pool = ThreadPoolExecutor(max_workers=1)
+        self._diff_future = self._diff_pool.submit(_build_viewer_diff, self.source_def, self.target_def)
+        self._poll_job = None
         
-        return DiffGenerator(source_text, target_text).side_by_side()
+        self._build_ui()
+        self._poll_job = self.after(_FUTURE_POLL_MS, self._poll_diff)
+    
+    def _poll_diff(self) -> None:
+        """Wait for the background diff from the Tk thread; widgets are only touched here."""
+        if not self._diff_future.done():
+            self._poll_job = self.after(_FUTURE_POLL_MS, self._poll_diff)
+            return
+        self._poll_job = None
+        self._on_diff_ready(self._diff_future)
+    
+    def destroy(self):
+        """Cancel pending callbacks and release the diff thread before closing the window."""
+        for job in ("_poll_job", "_shift_job", "_sync_job"):
+            if getattr(self, job) is not None:
+                self.after_cancel(getattr(self, job))
+                setattr(self, job, None)
+        self._pending_sync = None
+        self._diff_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
+    def _on_diff_ready(self, future) -> None:
+        """Show the diff computed by _build_viewer_diff."""
+        exc = future.exception()
+        if exc is not None:
+            self._status_label.configure(text=f"  Diff failed: {exc}  |  Status: {self.status}")
+            return
+        self.diff_data, self._line_nums, diff_count = future.result()
+        self._status_label.configure(text=f"  {diff_count} differences found  |  Status: {self.status}")
+        self._populate_diff()
     
     def _build_ui(self):
         self.grid_rowconfigure(1, weight=1)
@@ -1811,7 +2120,7 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         left_info = ctk.CTkLabel(
             info_bar,
             text=f"◄ SOURCE: {self.obj_type} - {self.obj_name}",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_font(size=11, weight="bold"),
             text_color="#ECF0F1",
             anchor="w"
         )
@@ -1821,7 +2130,7 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         right_info = ctk.CTkLabel(
             info_bar,
             text=f"TARGET ►: {self.obj_type} - {self.obj_name}",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_font(size=11, weight="bold"),
             text_color="#ECF0F1",
             anchor="w"
         )
@@ -1835,7 +2144,7 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         diff_container.grid_columnconfigure(1, weight=1)
         
         # Create text widgets with ExamDiff styling
-        mono_font = ctk.CTkFont(family="Consolas", size=10)
+        mono_font = _font(family="Consolas", size=10)
         
         # Left pane (SOURCE)
         self.left_text = ctk.CTkTextbox(
@@ -1860,12 +2169,14 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         # Configure ExamDiff-style color tags
         self._configure_tags()
         
-        # Populate with diff
-        self._populate_diff()
+        # Both panes scroll over all of diff_data, not just the rendered window
+        for pane in (self.left_text, self.right_text):
+            pane._y_scrollbar.configure(command=self._on_scrollbar)
+            pane._textbox.configure(yscrollcommand=lambda first, last, pane=pane: self._on_text_yscroll(pane, first, last))
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                pane._textbox.bind(sequence, self._on_wheel)
         
         # Bind synchronized scrolling
-        self.left_text._textbox.bind("<MouseWheel>", lambda e: self._sync_scroll(e, "left"))
-        self.right_text._textbox.bind("<MouseWheel>", lambda e: self._sync_scroll(e, "right"))
         self.left_text._textbox.bind("<Key>", lambda e: self._sync_scroll(e, "left"))
         self.right_text._textbox.bind("<Key>", lambda e: self._sync_scroll(e, "right"))
         
@@ -1873,16 +2184,16 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
         status_bar = ctk.CTkFrame(self, fg_color=("#ECF0F1", "#2C3E50"), height=32)
         status_bar.grid(row=2, column=0, sticky="ew", padx=0, pady=0)
         
-        diff_count = sum(1 for _, _, tag in self.diff_data if tag != "same")
-        status_text = f"  {diff_count} differences found  |  Status: {self.status}"
+        status_text = f"  Computing differences...  |  Status: {self.status}"
         
-        ctk.CTkLabel(
+        self._status_label = ctk.CTkLabel(
             status_bar,
             text=status_text,
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_font(size=10, weight="bold"),
             text_color=("#2C3E50", "#ECF0F1"),
             anchor="w"
-        ).pack(side="left", padx=12, pady=6)
+        )
+        self._status_label.pack(side="left", padx=12, pady=6)
         
         # Copy buttons
         button_frame = ctk.CTkFrame(status_bar, fg_color="transparent")
@@ -1932,59 +2243,112 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
             widget.tag_config("line_num", foreground="#95A5A6", background="#ECF0F1") # Muted gray
     
     def _populate_diff(self):
-        """Populate both panes with the diff data."""
-        self.left_text.configure(state="normal")
-        self.right_text.configure(state="normal")
+        """Populate both panes with the first window of the diff data."""
+        self._render_window(0)
+    
+    def _render_window(self, first: int) -> None:
+        """Render diff_data[first:first + self._window_size] into both panes."""
+        size = self._window_size
+        first = max(0, min(first, len(self.diff_data) - size))
+        window = self.diff_data[first:first + size]
+        self._window_first = first
+        self._window_len = len(window)
         
-        for idx, (left, right, tag) in enumerate(self.diff_data, start=1):
-            # Line numbers with padding
-            ln = f"{idx:5d} "
-            
+        # Build (text, tags) pairs per pane and insert each pane once,
+        # instead of insert/index/tag_add round trips for every line
+        left_parts: list[str] = []
+        right_parts: list[str] = []
+        for ln, (left, right, tag) in zip(self._line_nums[first:], window):
             # Determine background color for each side
-            left_tag = "same"
-            right_tag = "same"
-            
-            if tag == "add":
-                left_tag = "same"
-                right_tag = "add"
-            elif tag == "del":
-                left_tag = "del"
-                right_tag = "same"
-            elif tag == "chg":
-                left_tag = "chg"
-                right_tag = "chg"
-            
-            # Insert left side
-            ln_start = self.left_text.index("end-1c")
-            self.left_text.insert("end", ln)
-            ln_end = self.left_text.index("end-1c")
-            self.left_text.tag_add("line_num", ln_start, ln_end)
-            
-            content_start = self.left_text.index("end-1c")
-            self.left_text.insert("end", left + "\n")
-            content_end = self.left_text.index("end-1c")
-            if left.strip():
-                self.left_text.tag_add(left_tag, content_start, content_end)
+            left_tag, right_tag = _VIEWER_SIDE_TAGS.get(tag, ("same", "same"))
             
-            # Insert right side
-            ln_start = self.right_text.index("end-1c")
-            self.right_text.insert("end", ln)
-            ln_end = self.right_text.index("end-1c")
-            self.right_text.tag_add("line_num", ln_start, ln_end)
-            
-            content_start = self.right_text.index("end-1c")
-            self.right_text.insert("end", right + "\n")
-            content_end = self.right_text.index("end-1c")
-            if right.strip():
-                self.right_text.tag_add(right_tag, content_start, content_end)
+            left_parts += (ln, "line_num", left + "\n", left_tag if left.strip() else "")
+            right_parts += (ln, "line_num", right + "\n", right_tag if right.strip() else "")
+        
+        for widget, parts in ((self.left_text, left_parts), (self.right_text, right_parts)):
+            widget.configure(state="normal")
+            widget.delete("1.0", "end")
+            _insert_tagged(widget, parts)
+            widget.configure(state="disabled")
+    
+    def _view(self) -> tuple[float, float]:
+        """Return the (top, bottom) diff line positions visible in the panes."""
+        first, last = self.left_text._textbox.yview()
+        return self._window_first + first * self._window_len, self._window_first + last * self._window_len
+    
+    def _scroll_to(self, top: float, recentre: bool = False) -> None:
+        """Show diff line index top at the top of both panes.
+        
+        The rendered window is re-centred when the requested lines fall
+        outside it, or always when recentre is true.
+        """
+        self._shift_job = None
+        total = len(self.diff_data)
+        if not total:
+            return
+        view_top, view_bottom = self._view()
+        visible = max(1.0, view_bottom - view_top)
+        top = max(0.0, min(float(top), total - visible))
+        if recentre or not (self._window_first <= top and top + visible <= self._window_first + self._window_len):
+            # Centre the new window on the requested position; at least four
+            # screens tall, so the view lands outside the shift margin
+            self._window_size = size = max(_VIEWER_WINDOW_LINES, 4 * (int(visible) + 1))
+            self._render_window(int(top) - (size - int(visible)) // 2)
+        fraction = (top - self._window_first) / self._window_len
+        self.left_text._textbox.yview_moveto(fraction)
+        self.right_text._textbox.yview_moveto(fraction)
+    
+    def _on_scrollbar(self, action: str, *args) -> None:
+        """Scrollbar command: interpret moves relative to all diff lines."""
+        if not self.diff_data:
+            return
+        view_top, view_bottom = self._view()
+        if action == "moveto":
+            top = float(args[0]) * len(self.diff_data)
+        else:
+            # "scroll", count, "units" | "pages"
+            step = max(1.0, view_bottom - view_top) if args[1] == "pages" else 1.0
+            top = view_top + int(args[0]) * step
+        self._scroll_to(top)
+    
+    def _on_wheel(self, event):
+        """Scroll both panes together by three lines per wheel notch."""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._on_scrollbar("scroll", "-3", "units")
+        else:
+            self._on_scrollbar("scroll", "3", "units")
+        return "break"
+    
+    def _on_text_yscroll(self, pane, first: str, last: str) -> None:
+        """yscrollcommand for a pane: size its scrollbar against all diff lines.
         
-        self.left_text.configure(state="disabled")
-        self.right_text.configure(state="disabled")
+        When the view nears either edge of the rendered window, the window is
+        shifted on idle.
+        """
+        total = len(self.diff_data)
+        rendered = self._window_len
+        if not total or not rendered:
+            pane._y_scrollbar.set(0.0, 1.0)
+            return
+        offset = self._window_first
+        top = offset + float(first) * rendered
+        bottom = offset + float(last) * rendered
+        pane._y_scrollbar.set(top / total, bottom / total)
+        
+        margin = rendered // 4
+        near_top = offset > 0 and top - offset < margin
+        near_bottom = offset + rendered < total and offset + rendered - bottom < margin
+        if (near_top or near_bottom) and self._shift_job is None:
+            self._shift_job = self.after_idle(self._scroll_to, top, True)
+    
+    def _pane_text(self, side: int) -> str:
+        """Full text of one pane (0 = source, 1 = target), including unrendered lines."""
+        return "".join(f"{ln}{line[side]}\n" for ln, line in zip(self._line_nums, self.diff_data))
     
     def _copy_source(self):
         """Copy source content to clipboard."""
         try:
-            content = self.left_text.get("1.0", "end-1c")
+            content = self._pane_text(0)
             self.clipboard_clear()
             self.clipboard_append(content)
             self.update()  # Force clipboard update
@@ -1994,7 +2358,7 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
     def _copy_target(self):
         """Copy target content to clipboard."""
         try:
-            content = self.right_text.get("1.0", "end-1c")
+            content = self._pane_text(1)
             self.clipboard_clear()
             self.clipboard_append(content)
             self.update()
@@ -2004,8 +2368,8 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
     def _copy_both(self):
         """Copy both source and target to clipboard."""
         try:
-            source = self.left_text.get("1.0", "end-1c")
-            target = self.right_text.get("1.0", "end-1c")
+            source = self._pane_text(0)
+            target = self._pane_text(1)
             content = f"=== SOURCE ===\n{source}\n\n=== TARGET ===\n{target}"
             self.clipboard_clear()
             self.clipboard_append(content)
@@ -2014,7 +2378,19 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
             print(f"Failed to copy both: {e}")
     
     def _sync_scroll(self, event, source):
-        """Synchronize scrolling between panes."""
+        """Synchronize scrolling between panes.
+        
+        Bursts of events are coalesced: only the latest source pane is
+        recorded, and one yview_moveto is applied on idle.
+        """
+        if self._pending_sync is None:
+            self._sync_job = self.after_idle(self._apply_sync)
+        self._pending_sync = source
+        return "break"
+    
+    def _apply_sync(self):
+        source, self._pending_sync = self._pending_sync, None
+        self._sync_job = None
         try:
             other = self.right_text if source == "left" else self.left_text
             src = self.left_text if source == "left" else self.right_text
@@ -2023,8 +2399,6 @@ class FullScreenDiffViewer(ctk.CTkToplevel):
             other._textbox.yview_moveto(yview[0])
         except Exception:
             pass
-        
-        return "break"
 
 
 def launch():
@@ -2082,35 +2456,33 @@ class DeploymentWizard(ctk.CTkToplevel):
         self.text.configure(state="disabled")
 
     def _build_summary_body(self) -> str:
-        # Basic counts by status and object type
-        lines: list[str] = []
-        lines.append(f"Target database: {self.target_db}\n")
-        status_counts = {"IDENTICAL": 0, "DIFFERENT": 0, "MISSING_IN_TARGET": 0, "MISSING_IN_SOURCE": 0}
+        # Basic counts by status and object type, gathered in one pass
+        status_counts: Counter[str] = Counter()
+        to_script_by_type: Counter[str] = Counter()
         for obj_type, items in self.results.items():
             for item in items:
                 st = item.get("status")
-                if st in status_counts:
-                    status_counts[st] += 1
-        lines.append("Overall status counts:\n")
-        for key, val in status_counts.items():
-            lines.append(f"  - {key}: {val}\n")
+                status_counts[st] += 1
+                if st in ("MISSING_IN_TARGET", "DIFFERENT"):
+                    to_script_by_type[obj_type] += 1
 
-        lines.append("\nObjects to be scripted (by type):\n")
-        for obj_type, items in self.results.items():
-            to_script = [i for i in items if i.get("status") in ("MISSING_IN_TARGET", "DIFFERENT")]
-            if to_script:
-                lines.append(f"  - {obj_type}: {len(to_script)}\n")
+        buf = io.StringIO()
+        buf.write(f"Target database: {self.target_db}\n")
+        buf.write("Overall status counts:\n")
+        for key in ("IDENTICAL", "DIFFERENT", "MISSING_IN_TARGET", "MISSING_IN_SOURCE"):
+            buf.write(f"  - {key}: {status_counts[key]}\n")
+
+        buf.write("\nObjects to be scripted (by type):\n")
+        for obj_type, count in to_script_by_type.items():
+            buf.write(f"  - {obj_type}: {count}\n")
 
-        return "".join(lines)
+        return buf.getvalue()
 
     def _build_warnings_body(self) -> str:
-        lines: list[str] = []
-        for line in self.script_text.splitlines():
-            if "WARNING" in line or "NOTE:" in line:
-                lines.append(line + "\n")
-        if not lines:
-            lines.append("No warnings or notes were detected in the generated script.\n")
-        return "".join(lines)
+        matches = _WARN_RE.findall(self.script_text)
+        if not matches:
+            return "No warnings or notes were detected in the generated script.\n"
+        return "\n".join(matches) + "\n"
 
     def _show_step(self) -> None:
         if self.step <= 1:
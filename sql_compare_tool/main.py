@@ -1,8 +1,15 @@
 from gui.main_window import launch
+from utils.config import Config
 from utils.logger import setup_logger
 
 
 if __name__ == "__main__":
-    # Initialize logging system
-    setup_logger("sql_compare_tool")
+    # Initialize logging system; the settings are only read, so a missing
+    # or read-only config directory does not stop the app from starting
+    logging_config = Config.read_section("logging")
+    setup_logger(
+        "sql_compare_tool",
+        max_file_size_mb=logging_config.get("max_file_size_mb", 10),
+        backup_count=logging_config.get("backup_count", 5),
+    )
     launch()
@@ -1,8 +1,10 @@
 """Unit tests for core SQL Compare Tool components."""
 from __future__ import annotations
 
+import tempfile
+import threading
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest import mock
 from pathlib import Path
 import sys
 
@@ -13,7 +15,9 @@ sys.path.insert(0, str(parent_dir))
 from core.database import DatabaseConnection
 from core.comparator import SchemaComparator, STATUS
 from core.diff_generator import DiffGenerator
+from utils import config as config_module
 from utils.config import Config
+from utils.project_manager import ProjectManager
 
 
 class TestDatabaseConnection(unittest.TestCase):
@@ -178,35 +182,98 @@ class TestDiffGenerator(unittest.TestCase):
 class TestConfig(unittest.TestCase):
     """Test configuration management."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one Config backed by a temporary file for all tests."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.cfg = Config(config_path=Path(cls._tmp.name) / "test_config.json")
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.cfg.flush()
+        cls._tmp.cleanup()
+    
     def test_default_config_loaded(self):
         """Test that default configuration is loaded."""
-        config = Config(config_file="test_config.json")
-        
-        self.assertIn("app", config.config)
-        self.assertIn("database", config.config)
+        self.assertTrue(self.cfg.get_section("app"))
+        self.assertTrue(self.cfg.get_section("database"))
     
     def test_get_value(self):
         """Test getting configuration values."""
-        config = Config(config_file="test_config.json")
-        
-        value = config.get("database", "default_timeout", 30)
+        value = self.cfg.get("database", "connection_timeout")
         self.assertEqual(value, 30)
+        self.assertEqual(self.cfg.get("database", "missing_key", 5), 5)
     
     def test_set_value(self):
         """Test setting configuration values."""
-        config = Config(config_file="test_config.json")
-        
-        config.set("database", "default_timeout", 60)
-        value = config.get("database", "default_timeout")
+        self.cfg.set("database", "default_timeout", 60)
+        value = self.cfg.get("database", "default_timeout")
         self.assertEqual(value, 60)
     
     def test_get_section(self):
         """Test getting entire configuration section."""
-        config = Config(config_file="test_config.json")
-        
-        db_config = config.get_section("database")
+        db_config = self.cfg.get_section("database")
         self.assertIsInstance(db_config, dict)
-        self.assertIn("default_timeout", db_config)
+        self.assertIn("connection_timeout", db_config)
+    
+    def test_read_section_does_not_write(self):
+        """Test that read_section reads a section and never creates the file."""
+        missing = Path(self._tmp.name) / "missing" / "settings.json"
+        self.assertEqual(Config.read_section("logging", missing), {})
+        self.assertFalse(missing.parent.exists())
+        
+        self.cfg.flush()
+        self.assertEqual(
+            Config.read_section("logging", self.cfg.config_path),
+            self.cfg.get_section("logging"),
+        )
+    
+    def test_get_instance_shared_per_path(self):
+        """Test that get_instance returns one Config per resolved file path."""
+        first = Path(self._tmp.name) / "shared.json"
+        other = Path(self._tmp.name) / "other.json"
+        instance = Config.get_instance(first)
+        self.assertIs(Config.get_instance(first), instance)
+        self.assertIs(Config.get_instance(Path(self._tmp.name) / "." / "shared.json"), instance)
+        self.assertIsNot(Config.get_instance(other), instance)
+    
+    def test_sets_within_delay_share_one_write(self):
+        """Test that several set() calls are written to disk once."""
+        cfg = Config(config_path=Path(self._tmp.name) / "batched.json")
+        saved = threading.Event()
+        write = cfg._save_config
+        with mock.patch.object(config_module, "SAVE_DELAY_SECONDS", 0.05), \
+                mock.patch.object(cfg, "_save_config", side_effect=lambda: (write(), saved.set())) as save:
+            for timeout in (10, 20, 30):
+                cfg.set("database", "connection_timeout", timeout)
+            self.assertTrue(saved.wait(5))
+            cfg.flush()
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(Config(config_path=cfg.config_path).get("database", "connection_timeout"), 30)
+    
+    def test_flush_writes_pending_changes(self):
+        """Test that flush() writes a pending set() without waiting for the timer."""
+        cfg = Config(config_path=Path(self._tmp.name) / "flushed.json")
+        cfg.set("app", "theme", "green")
+        cfg.flush()
+        self.assertIsNone(cfg._save_timer)
+        self.assertEqual(Config(config_path=cfg.config_path).get("app", "theme"), "green")
+
+
+class TestProjectManager(unittest.TestCase):
+    """Test project file save/load."""
+    
+    def test_custom_filters_round_trip(self):
+        """Test that custom filters are saved as elements and loaded as a list."""
+        filters = [{"mode": "exclude", "field": "schema", "pattern": "audit"}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "project.xml"
+            manager = ProjectManager()
+            manager.save({"filters": {"show_diff": True, "custom_filters": filters}}, path)
+            data = manager.load(path)
+        
+        self.assertEqual(data["filters"]["custom_filters"], filters)
+        self.assertEqual(data["filters"]["show_diff"], "True")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""Unit tests for comparison report exports."""
+from __future__ import annotations
+
+import csv
+import json
+import re
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils import report_generator
+from utils.report_generator import (
+    PDF_CANVAS_ROW_THRESHOLD,
+    export_csv,
+    export_excel,
+    export_html,
+    export_json,
+    export_pdf,
+)
+
+
+RESULTS = {
+    "tables": [
+        {"name": "dbo.Orders", "status": "IDENTICAL"},
+        {"name": "dbo.<Odd & Name>", "status": "DIFFERENT", "details": {"columns": ["id"]}},
+    ],
+    "views": [
+        {"name": "sales.Totals", "status": "MISSING_IN_TARGET"},
+    ],
+}
+
+ROWS = [
+    ["tables", "dbo.Orders", "IDENTICAL"],
+    ["tables", "dbo.<Odd & Name>", "DIFFERENT"],
+    ["views", "sales.Totals", "MISSING_IN_TARGET"],
+]
+
+
+def _pdf_page_count(path: Path) -> int:
+    """Page count from the PDF page tree, whose objects reportlab leaves uncompressed."""
+    data = path.read_bytes()
+    assert data.startswith(b"%PDF-") and data.rstrip().endswith(b"%%EOF")
+    return int(re.search(rb"/Count (\d+)", data).group(1))
+
+
+class TestReportExports(unittest.TestCase):
+    """Test that every export writes back the rows it was given."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        # Exports create missing parent directories
+        self.out_dir = Path(self._tmp.name) / "exports"
+
+    def test_csv_round_trip(self):
+        """Test that the CSV has a header and one row per object."""
+        path = self.out_dir / "report.csv"
+        export_csv(RESULTS, path)
+
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        self.assertEqual(rows, [["Type", "Name", "Status"], *ROWS])
+
+    def test_html_round_trip(self):
+        """Test that the HTML has one escaped table row per object."""
+        path = self.out_dir / "report.html"
+        export_html(RESULTS, path)
+
+        text = path.read_text(encoding="utf-8")
+        cells = re.findall(r"<tr class='(\w+)'><td>(.*?)</td><td>(.*?)</td><td>(.*?)</td></tr>", text)
+
+        self.assertEqual(
+            cells,
+            [
+                ("IDENTICAL", "tables", "dbo.Orders", "IDENTICAL"),
+                ("DIFFERENT", "tables", "dbo.&lt;Odd &amp; Name&gt;", "DIFFERENT"),
+                ("MISSING_IN_TARGET", "views", "sales.Totals", "MISSING_IN_TARGET"),
+            ],
+        )
+        self.assertTrue(text.endswith("</table></body></html>"))
+
+    def test_json_round_trip(self):
+        """Test that the JSON export loads back to the same results."""
+        path = self.out_dir / "report.json"
+        export_json(RESULTS, path)
+
+        self.assertEqual(json.loads(path.read_bytes()), RESULTS)
+
+    def test_excel_round_trip(self):
+        """Test that the Objects sheet holds a header and one row per object."""
+        from openpyxl import load_workbook
+
+        path = self.out_dir / "report.xlsx"
+        export_excel(RESULTS, path)
+
+        wb = load_workbook(path, read_only=True)
+        try:
+            rows = [list(row) for row in wb["Objects"].iter_rows(values_only=True)]
+        finally:
+            wb.close()
+
+        self.assertEqual(rows, [["Type", "Name", "Status"], *ROWS])
+
+    def test_pdf_small_report(self):
+        """Test that a small report is laid out as a table on one page."""
+        path = self.out_dir / "report.pdf"
+        with mock.patch.object(report_generator, "_export_pdf_canvas") as canvas_export:
+            export_pdf(RESULTS, path)
+
+        canvas_export.assert_not_called()
+        self.assertEqual(_pdf_page_count(path), 1)
+
+    def test_pdf_large_report_uses_canvas(self):
+        """Test that a report above PDF_CANVAS_ROW_THRESHOLD is streamed onto the canvas."""
+        count = PDF_CANVAS_ROW_THRESHOLD + 1
+        results = {"tables": [{"name": f"dbo.Table{i}", "status": "DIFFERENT"} for i in range(count)]}
+        path = self.out_dir / "large.pdf"
+        with mock.patch.object(
+            report_generator, "_export_pdf_canvas", wraps=report_generator._export_pdf_canvas
+        ) as canvas_export:
+            export_pdf(results, path)
+
+        canvas_export.assert_called_once()
+        # Fewer than 40 rows fit on an A4 landscape page, so the rows must run on page after page
+        self.assertGreater(_pdf_page_count(path), count // 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,267 @@
+"""Unit tests for loading T-SQL script folders."""
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils import sql_parser
+from utils.sql_parser import load_script_folder, script_cache_path
+
+
+class TestLoadScriptFolder(unittest.TestCase):
+    """Test parsing object headers from script files."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+
+    def _write(self, relative: str, text: str) -> Path:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def _load(self) -> dict:
+        return load_script_folder(self.root, cache_path=None)
+
+    def test_multi_batch_script_loads_every_object(self):
+        """Test that each GO batch of a script becomes its own object."""
+        self._write("multi.sql", (
+            "CREATE VIEW dbo.V1 AS SELECT 1\n"
+            "GO\n"
+            "CREATE PROCEDURE dbo.P1 AS SELECT 2\n"
+            "GO\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["views"]), ["dbo.V1"])
+        self.assertEqual(list(meta["procedures"]), ["dbo.P1"])
+        self.assertEqual(meta["views"]["dbo.V1"]["definition"], "CREATE VIEW dbo.V1 AS SELECT 1\nGO\n")
+        self.assertEqual(meta["procedures"]["dbo.P1"]["definition"], "CREATE PROCEDURE dbo.P1 AS SELECT 2\nGO\n")
+
+    def test_go_with_repeat_count_separates_batches(self):
+        """Test that GO followed by a repeat count still ends the batch."""
+        self._write("multi.sql", (
+            "CREATE PROCEDURE dbo.P1 AS SELECT 1\n"
+            "GO 2\n"
+            "CREATE VIEW dbo.V1 AS SELECT 2\n"
+            "go 10 -- run it ten times\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["procedures"]), ["dbo.P1"])
+        self.assertEqual(list(meta["views"]), ["dbo.V1"])
+        self.assertEqual(meta["procedures"]["dbo.P1"]["definition"], "CREATE PROCEDURE dbo.P1 AS SELECT 1\nGO 2\n")
+
+    def test_tables_sharing_a_batch_all_loaded(self):
+        """Test that several CREATE TABLE statements in one batch are separate objects."""
+        self._write("tables.sql", (
+            "CREATE TABLE dbo.a1 (id int);\n"
+            "\n"
+            "CREATE TABLE dbo.a2 (id int);\n"
+            "CREATE SYNONYM dbo.s1 FOR dbo.a1;\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(sorted(meta["tables"]), ["dbo.a1", "dbo.a2"])
+        self.assertEqual(list(meta["synonyms"]), ["dbo.s1"])
+        self.assertEqual(meta["tables"]["dbo.a1"]["definition"], "CREATE TABLE dbo.a1 (id int);\n\n")
+        self.assertEqual(meta["tables"]["dbo.a2"]["definition"], "CREATE TABLE dbo.a2 (id int);\n")
+
+    def test_temp_tables_not_loaded(self):
+        """Test that #temp tables stay part of their procedure and are never objects."""
+        self._write("proc.sql", (
+            "CREATE PROCEDURE dbo.Load AS\n"
+            "BEGIN\n"
+            "    CREATE TABLE #work (id int);\n"
+            "    CREATE TABLE dbo.Staging (id int);\n"
+            "END\n"
+            "GO\n"
+            "CREATE TABLE #scratch (id int);\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["procedures"]), ["dbo.Load"])
+        self.assertEqual(meta["tables"], {})
+        self.assertIn("CREATE TABLE #work", meta["procedures"]["dbo.Load"]["definition"])
+
+    def test_brackets_stripped_and_schema_defaulted(self):
+        """Test that [schema].[name] is normalised and a bare name gets the dbo schema."""
+        self._write("a.sql", "CREATE TABLE [sales].[Orders] (id int)\n")
+        self._write("b.sql", "CREATE VIEW [Totals] AS SELECT 1\n")
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["tables"]), ["sales.Orders"])
+        self.assertEqual(list(meta["views"]), ["dbo.Totals"])
+
+    def test_hidden_directories_skipped(self):
+        """Test that scripts under dot-directories such as .git are not loaded."""
+        self._write("sub/t.sql", "CREATE TABLE dbo.Kept (id int)\n")
+        self._write(".git/t.sql", "CREATE TABLE dbo.Hidden (id int)\n")
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["tables"]), ["dbo.Kept"])
+
+    def test_header_in_block_comment_ignored(self):
+        """Test that a CREATE line inside a /* */ comment is not taken for the object."""
+        self._write("v.sql", (
+            "/*\n"
+            "CREATE VIEW dbo.OldOrders AS SELECT 1\n"
+            "*/\n"
+            "CREATE VIEW dbo.Orders AS SELECT 2\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["views"]), ["dbo.Orders"])
+
+    def test_nested_block_comment_ignored(self):
+        """Test that block comments nest, as in T-SQL."""
+        self._write("p.sql", (
+            "/* outer\n"
+            "/* inner */\n"
+            "CREATE PROCEDURE dbo.Old AS SELECT 1\n"
+            "*/\n"
+            "-- a line comment with /* is not a block comment\n"
+            "PRINT '/* nor is a string literal'\n"
+            "CREATE PROCEDURE dbo.Current AS SELECT 2\n"
+        ))
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["procedures"]), ["dbo.Current"])
+
+    def test_header_after_comment_on_same_line(self):
+        """Test that a header directly following a block comment on its line is loaded."""
+        self._write("v.sql", "/* version 2 */ CREATE VIEW dbo.Orders AS SELECT 1\n")
+
+        meta = self._load()
+
+        self.assertEqual(list(meta["views"]), ["dbo.Orders"])
+
+    def test_quote_in_identifier_does_not_hide_comments(self):
+        """Test that a quote inside [bracketed] or "quoted" names does not open a string literal."""
+        for name, table in (("bracketed.sql", "[dbo].[O'Brien]"), ("quoted.sql", '"dbo"."O\'Brien"')):
+            with self.subTest(table=table):
+                self._write(name, (
+                    f"CREATE TABLE {table} (id int)\n"
+                    "GO\n"
+                    "/*\n"
+                    "CREATE VIEW dbo.Retired AS SELECT 1\n"
+                    "*/\n"
+                ))
+
+                meta = self._load()
+
+                self.assertEqual(meta["views"], {})
+                (self.root / name).unlink()
+
+    def test_script_with_only_commented_header_skipped(self):
+        """Test that a script whose only header is commented out creates no object."""
+        self._write("t.sql", "/* kept for reference\nCREATE TABLE dbo.Gone (id int)\n*/\n")
+
+        meta = self._load()
+
+        self.assertFalse(any(meta.values()))
+
+
+class TestScriptCache(unittest.TestCase):
+    """Test the parsed-script cache kept in the app cache directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "scripts"
+        self.root.mkdir()
+        self.cache_dir = Path(self._tmp.name) / "cache"
+        self.cache_path = script_cache_path(self.root, self.cache_dir)
+        (self.root / "a.sql").write_text("CREATE VIEW dbo.A AS SELECT 1\n", encoding="utf-8")
+        (self.root / "b.sql").write_text("CREATE VIEW dbo.B AS SELECT 1\n", encoding="utf-8")
+
+    def _load(self):
+        """Load the folder through the cache; return (metadata, names of the files read)."""
+        with mock.patch.object(sql_parser, "_parse_one", wraps=sql_parser._parse_one) as parse:
+            meta = load_script_folder(self.root, cache_path=self.cache_path)
+        return meta, sorted(Path(call.args[0]).name for call in parse.call_args_list)
+
+    def _cached_paths(self) -> list[str]:
+        conn = sqlite3.connect(self.cache_path)
+        try:
+            return sorted(Path(path).name for (path,) in conn.execute("SELECT DISTINCT path FROM files"))
+        finally:
+            conn.close()
+
+    def test_cache_kept_outside_the_scripts_folder(self):
+        """Test that each folder gets its own cache file and the folder is not written to."""
+        self._load()
+
+        self.assertTrue(self.cache_path.is_file())
+        self.assertEqual(self.cache_path.parent, self.cache_dir)
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), ["a.sql", "b.sql"])
+        self.assertNotEqual(script_cache_path(self.cache_dir, self.cache_dir), self.cache_path)
+
+    def test_unreadable_cache_falls_back_to_reading(self):
+        """Test that a cache failing its lookups is ignored and every script is read."""
+        first, _ = self._load()
+        conn = sqlite3.connect(self.cache_path)
+        try:
+            # Same version, wrong layout: the per-file SELECT fails
+            conn.executescript("DROP TABLE files; CREATE TABLE files (path TEXT);")
+        finally:
+            conn.close()
+
+        with self.assertLogs(sql_parser.logger, "WARNING"):
+            meta, read = self._load()
+
+        self.assertEqual(read, ["a.sql", "b.sql"])
+        self.assertEqual(meta, first)
+
+    def test_unchanged_files_served_from_cache(self):
+        """Test that a second load reads no file and returns the same objects."""
+        first, read = self._load()
+        self.assertEqual(read, ["a.sql", "b.sql"])
+
+        second, read = self._load()
+
+        self.assertEqual(read, [])
+        self.assertEqual(second, first)
+
+    def test_modified_file_read_again(self):
+        """Test that only a script whose size or mtime changed is parsed again."""
+        self._load()
+        (self.root / "a.sql").write_text("CREATE VIEW dbo.A AS SELECT 1, 2\n", encoding="utf-8")
+
+        meta, read = self._load()
+
+        self.assertEqual(read, ["a.sql"])
+        self.assertEqual(meta["views"]["dbo.A"]["definition"], "CREATE VIEW dbo.A AS SELECT 1, 2\n")
+
+    def test_deleted_file_pruned(self):
+        """Test that a deleted script disappears from the results and the cache."""
+        self._load()
+        (self.root / "b.sql").unlink()
+
+        meta, read = self._load()
+
+        self.assertEqual(read, [])
+        self.assertEqual(list(meta["views"]), ["dbo.A"])
+        self.assertEqual(self._cached_paths(), ["a.sql"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,19 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from utils.json_io import dumps, loads
+
+# Delay before a set() is written to disk; further sets within it share the write
+SAVE_DELAY_SECONDS = 0.25
+
+# Shared instances by resolved config path, see Config.get_instance
+_INSTANCES: Dict[Path, "Config"] = {}
+_INSTANCES_LOCK = threading.Lock()
+
 
 class Config:
     """Application configuration management using JSON."""
@@ -15,21 +25,63 @@ class Config:
         Args:
             config_path: Path to configuration file. If None, uses default location.
         """
-        if config_path is None:
-            # Default to config directory in project root
-            self.config_path = Path(__file__).parent.parent.parent / "config" / "settings.json"
-        else:
-            self.config_path = Path(config_path)
+        self.config_path = self._resolve_path(config_path)
         
         self._config: Dict[str, Any] = {}
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
         self._load_config()
     
+    @staticmethod
+    def _resolve_path(config_path: Optional[Path]) -> Path:
+        if config_path is None:
+            # Default to config directory in project root
+            return Path(__file__).parent.parent.parent / "config" / "settings.json"
+        return Path(config_path)
+    
+    @classmethod
+    def get_instance(cls, config_path: Optional[Path] = None) -> "Config":
+        """Get the shared configuration for a file, loading it only once per process.
+        
+        Args:
+            config_path: Path to configuration file. If None, uses default location.
+            
+        Returns:
+            Config instance shared by all callers using the same file
+        """
+        key = cls._resolve_path(config_path).resolve()
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(key)
+            if instance is None:
+                instance = _INSTANCES[key] = cls(key)
+            return instance
+    
+    @classmethod
+    def read_section(cls, section: str, config_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Read one section of the configuration file without creating or writing it.
+        
+        Args:
+            section: Section name
+            config_path: Path to configuration file. If None, uses default location.
+            
+        Returns:
+            Section dictionary, or an empty dict if the file or section is
+            missing or cannot be read
+        """
+        try:
+            data = loads(cls._resolve_path(config_path).read_bytes())
+        except (OSError, ValueError):
+            # json.JSONDecodeError (and orjson's) subclass ValueError
+            return {}
+        section_data = data.get(section) if isinstance(data, dict) else None
+        return section_data if isinstance(section_data, dict) else {}
+    
     def _load_config(self) -> None:
         """Load configuration from file or create with defaults."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
+                self._config = loads(self.config_path.read_bytes())
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading config: {e}. Using defaults.")
                 self._config = self._get_defaults()
@@ -41,8 +93,7 @@ class Config:
     def _save_config(self) -> None:
         """Save current configuration to file."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self._config, f, indent=2)
+        self.config_path.write_bytes(dumps(self._config))
     
     def _get_defaults(self) -> Dict[str, Any]:
         """Get default configuration values."""
@@ -102,11 +153,36 @@ class Config:
             key: Key within section
             value: Value to set
         """
-        if section not in self._config:
-            self._config[section] = {}
+        # The save timer serialises _config on its own thread, so changes
+        # are made under the same lock
+        with self._lock:
+            if section not in self._config:
+                self._config[section] = {}
+            
+            self._config[section][key] = value
+            self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Write the configuration after SAVE_DELAY_SECONDS, restarting the delay on each call.
         
-        self._config[section][key] = value
-        self._save_config()
+        Must be called with self._lock held.
+        """
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+        self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending changes from set() to disk now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_config()
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get entire configuration section.
@@ -121,4 +197,6 @@ class Config:
     
     def reload(self) -> None:
         """Reload configuration from file."""
-        self._load_config()
+        self.flush()
+        with self._lock:
+            self._load_config()
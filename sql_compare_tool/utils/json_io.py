@@ -0,0 +1,25 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the stdlib encoder
+    orjson = None
+    import json
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON; unknown types are written with str()."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON; unknown types are written with str()."""
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+    loads = json.loads
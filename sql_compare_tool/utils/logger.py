@@ -1,19 +1,37 @@
 """Centralized logging configuration for SQL Compare Tool."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 
+# Background listeners by logger name; kept referenced and stopped at exit
+# so queued records are flushed.
+_LISTENERS: dict[str, QueueListener] = {}
 
-def setup_logger(name: str = "sql_compare_tool", log_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
+
+def setup_logger(
+    name: str = "sql_compare_tool",
+    log_dir: str = "logs",
+    level: int = logging.INFO,
+    max_file_size_mb: int = 10,
+    backup_count: int = 5,
+) -> logging.Logger:
     """Configure and return a logger instance.
     
+    Records are handed to a queue and written by a background thread, so
+    logging calls never wait on disk or console I/O.
+    
     Args:
         name: Logger name (typically __name__ from calling module)
         log_dir: Directory to store log files
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        max_file_size_mb: Size at which the log file is rotated
+        backup_count: Number of rotated log files to keep
     
     Returns:
         Configured logger instance
@@ -30,9 +48,14 @@ def setup_logger(name: str = "sql_compare_tool", log_dir: str = "logs", level: i
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
     
-    # File handler with rotation by date
+    # File handler named by date, rotated by size
     log_file = log_path / f"sql_compare_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=max_file_size_mb * (1 << 20),
+        backupCount=backup_count,
+        encoding='utf-8',
+    )
     file_handler.setLevel(logging.DEBUG)
     
     # Console handler for errors and warnings
@@ -52,8 +75,13 @@ def setup_logger(name: str = "sql_compare_tool", log_dir: str = "logs", level: i
     )
     console_handler.setFormatter(console_formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _LISTENERS[name] = listener
+    atexit.register(listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -5,53 +5,84 @@ from pathlib import Path
 from typing import Dict, Any
 
 
+# Version 2 stores custom filters as nested <Filter> elements instead of a
+# JSON string; version 1 files are still read.
+PROJECT_VERSION = 2
+
+# Connection sections and their child element -> key mapping
+_CONN_SECTIONS = ("Source", "Target")
+_CONN_FIELDS = {"Server": "server", "Database": "database", "Auth": "auth", "Username": "username"}
+
+
 class ProjectManager:
     """Save/load simple project files with source/target and filter settings."""
 
     def save(self, data: Dict[str, Any], path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        root = ET.Element("SQLCompareProject")
+        root = ET.Element("SQLCompareProject", {"version": str(PROJECT_VERSION)})
 
         def add_conn(parent, label, info):
             node = ET.SubElement(parent, label)
-            ET.SubElement(node, "Server").text = info.get("server", "")
-            ET.SubElement(node, "Database").text = info.get("database", "")
-            ET.SubElement(node, "Auth").text = info.get("auth", "")
-            ET.SubElement(node, "Username").text = info.get("username", "")
+            fields = []
+            for tag, key in _CONN_FIELDS.items():
+                field = ET.Element(tag)
+                field.text = info.get(key, "")
+                fields.append(field)
+            node.extend(fields)
         add_conn(root, "Source", data.get("source", {}))
         add_conn(root, "Target", data.get("target", {}))
 
         filters = data.get("filters", {})
         fil_node = ET.SubElement(root, "Filters")
+        children = []
         for k, v in filters.items():
-            ET.SubElement(fil_node, k).text = str(v)
+            node = ET.Element(k)
+            if isinstance(v, list):
+                # Lists of dicts (e.g. custom filters) become child elements
+                node.extend(ET.Element("Filter", {key: str(val) for key, val in entry.items()}) for entry in v)
+            else:
+                node.text = str(v)
+            children.append(node)
+        # Attach the children in one call rather than one SubElement each
+        fil_node.extend(children)
 
         tree = ET.ElementTree(root)
         tree.write(path, encoding="utf-8", xml_declaration=True)
 
     def load(self, path: Path) -> Dict[str, Any]:
-        tree = ET.parse(path)
-        root = tree.getroot()
-
-        def read_conn(label):
-            node = root.find(label)
-            if node is None:
-                return {}
-            return {
-                "server": (node.findtext("Server") or ""),
-                "database": (node.findtext("Database") or ""),
-                "auth": (node.findtext("Auth") or ""),
-                "username": (node.findtext("Username") or ""),
-            }
-
+        # Single streaming pass; each section is read when its element
+        # closes and then cleared, so the full tree is never kept.
+        conns: Dict[str, Dict[str, str]] = {}
         filters = {}
-        fil_node = root.find("Filters")
-        if fil_node is not None:
-            for child in fil_node:
-                filters[child.tag] = child.text
+        open_tags = []
+        for event, elem in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                open_tags.append(elem.tag)
+                continue
+            open_tags.pop()
+            depth = len(open_tags)
+            if depth == 2:
+                section = open_tags[1]
+                if section in _CONN_SECTIONS:
+                    conn = conns.setdefault(section, {})
+                    field = _CONN_FIELDS.get(elem.tag)
+                    if field and field not in conn:
+                        conn[field] = elem.text or ""
+                elif section == "Filters":
+                    if len(elem):
+                        filters[elem.tag] = [dict(sub.attrib) for sub in elem]
+                    else:
+                        filters[elem.tag] = elem.text
+                elem.clear()
+            elif depth == 1:
+                if elem.tag in _CONN_SECTIONS:
+                    conn = conns.setdefault(elem.tag, {})
+                    for field in _CONN_FIELDS.values():
+                        conn.setdefault(field, "")
+                elem.clear()
 
         return {
-            "source": read_conn("Source"),
-            "target": read_conn("Target"),
+            "source": conns.get("Source", {}),
+            "target": conns.get("Target", {}),
             "filters": filters,
         }
@@ -1,67 +1,87 @@
 from __future__ import annotations
 
 import csv
-import json
 import html
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Tuple
 
-from openpyxl import Workbook
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from utils.json_io import dumps
+
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Reports with more rows than this are drawn straight onto the PDF canvas
+PDF_CANVAS_ROW_THRESHOLD = 5000
+# Rows measured (after the header) to size the canvas PDF columns
+_PDF_SAMPLE_ROWS = 100
+
+
+def _iter_rows(results: Dict[str, List[Dict[str, Any]]]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (type, name, status) rows without materialising the report."""
+    for obj_type, items in results.items():
+        for item in items:
+            yield obj_type, item.get("name", ""), item.get("status", "")
 
 
 def export_csv(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(["Type", "Name", "Status"])
-        for obj_type, items in results.items():
-            for item in items:
-                writer.writerow([obj_type, item.get("name", ""), item.get("status", "")])
+        # writerows drives the generator from C, one row at a time
+        writer.writerows(_iter_rows(results))
+
+
+_HTML_HEAD = (
+    "<!DOCTYPE html>\n"
+    "<html><head><meta charset='utf-8'><title>SQL Compare Report</title>\n"
+    "<style>table{border-collapse:collapse;width:100%;}th,td{border:1px solid #ccc;padding:6px;} .IDENTICAL{background:#f2f2f2;} .DIFFERENT{background:#fffacd;} .MISSING_IN_TARGET{background:#e6ffe6;} .MISSING_IN_SOURCE{background:#ffe6e6;}</style>\n"
+    "</head><body>\n"
+    "<h2>SQL Compare Report</h2>\n"
+    "<table><tr><th>Type</th><th>Name</th><th>Status</th></tr>\n"
+)
+_HTML_STATUSES = {
+    status: html.escape(status)
+    for status in ("IDENTICAL", "DIFFERENT", "MISSING_IN_TARGET", "MISSING_IN_SOURCE")
+}
 
 
 def export_html(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    rows = []
-    for obj_type, items in results.items():
-        for item in items:
-            rows.append((obj_type, item.get("name", ""), item.get("status", "")))
-
-    html = [
-        "<!DOCTYPE html>",
-        "<html><head><meta charset='utf-8'><title>SQL Compare Report</title>",
-        "<style>table{border-collapse:collapse;width:100%;}th,td{border:1px solid #ccc;padding:6px;} .IDENTICAL{background:#f2f2f2;} .DIFFERENT{background:#fffacd;} .MISSING_IN_TARGET{background:#e6ffe6;} .MISSING_IN_SOURCE{background:#ffe6e6;}</style>",
-        "</head><body>",
-        "<h2>SQL Compare Report</h2>",
-        "<table><tr><th>Type</th><th>Name</th><th>Status</th></tr>",
-    ]
-    for obj_type, name, status in rows:
-        obj = html.escape(obj_type)
-        nm = html.escape(name)
-        st = html.escape(status)
-        html.append(f"<tr class='{st}'><td>{obj}</td><td>{nm}</td><td>{st}</td></tr>")
-    html.append("</table></body></html>")
-
-    path.write_text("\n".join(html), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_HTML_HEAD)
+        # Types and statuses repeat on every row; escape each distinct value once
+        escaped = dict(_HTML_STATUSES)
+        for obj_type, name, status in _iter_rows(results):
+            obj = escaped.get(obj_type)
+            if obj is None:
+                obj = escaped[obj_type] = html.escape(obj_type)
+            st = escaped.get(status)
+            if st is None:
+                st = escaped[status] = html.escape(status)
+            nm = html.escape(name)
+            f.write(f"<tr class='{st}'><td>{obj}</td><td>{nm}</td><td>{st}</td></tr>\n")
+        f.write("</table></body></html>")
 
 
 def export_json(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(results, indent=2, default=str), encoding="utf-8")
+    path.write_bytes(dumps(results))
 
 
 def export_excel(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
+    # openpyxl is a heavy import; load it only when an Excel export runs.
+    from openpyxl import Workbook
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Objects"
+    # Write-only mode streams rows to a temp file instead of keeping a cell
+    # object per value; no styling is applied, so nothing is lost.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Objects")
     ws.append(["Type", "Name", "Status"])
-    for obj_type, items in results.items():
-        for item in items:
-            ws.append([obj_type, item.get("name", ""), item.get("status", "")])
+    for row in _iter_rows(results):
+        ws.append(row)
     wb.save(path)
 
 
@@ -70,9 +90,19 @@ def export_pdf(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
 
     The PDF contains a title and a single table with Type/Name/Status
     columns. It is intentionally lightweight but suitable for sharing
-    compare results.
+    compare results. Large reports skip Platypus table layout, which
+    measures every cell, and use _export_pdf_canvas instead.
     """
 
+    if sum(len(items) for items in results.values()) > PDF_CANVAS_ROW_THRESHOLD:
+        _export_pdf_canvas(results, path)
+        return
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
+
     path.parent.mkdir(parents=True, exist_ok=True)
 
     doc = SimpleDocTemplate(str(path), pagesize=landscape(A4))
@@ -83,16 +113,14 @@ def export_pdf(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
     elements.append(title)
     elements.append(Spacer(1, 12))
 
-    data: list[list[str]] = [["Type", "Name", "Status"]]
-    for obj_type, items in results.items():
-        for item in items:
-            data.append([
-                str(obj_type),
-                str(item.get("name", "")),
-                str(item.get("status", "")),
-            ])
+    # A list, not a generator: the table needs len(data)
+    data: list[list[str]] = [
+        ["Type", "Name", "Status"],
+        *([str(obj_type), str(name), str(status)] for obj_type, name, status in _iter_rows(results)),
+    ]
 
-    table = Table(data, repeatRows=1)
+    # LongTable lays out page by page instead of sizing the whole table up front
+    table = LongTable(data, repeatRows=1, splitByRow=1)
     table.setStyle(
         TableStyle(
             [
@@ -109,3 +137,76 @@ def export_pdf(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
 
     elements.append(table)
     doc.build(elements)
+
+
+def _export_pdf_canvas(results: Dict[str, List[Dict[str, Any]]], path: Path) -> None:
+    """Stream the export_pdf layout page by page onto a reportlab canvas.
+
+    Column widths come from the header and the first _PDF_SAMPLE_ROWS rows;
+    the Name column takes the remaining width and longer values are clipped.
+    """
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    page_width, page_height = landscape(A4)
+    margin = inch
+    row_height = 12.0
+    padding = 6.0
+    header = ("Type", "Name", "Status")
+
+    rows = ((str(obj_type), str(name), str(status)) for obj_type, name, status in _iter_rows(results))
+    sample = list(islice(rows, _PDF_SAMPLE_ROWS))
+    widths = [
+        max(stringWidth(row[col], "Helvetica", 8) for row in (header, *sample)) + 2 * padding
+        for col in range(3)
+    ]
+    widths[1] = max(page_width - 2 * margin - widths[0] - widths[2], 0.0)
+    edges = [margin, margin + widths[0], margin + widths[0] + widths[1], margin + sum(widths)]
+
+    def draw_page(top: float, page_rows: list) -> None:
+        bottom = top - (len(page_rows) + 1) * row_height
+        c.setFillColor(colors.lightgrey)
+        c.rect(edges[0], top - row_height, edges[-1] - edges[0], row_height, stroke=0, fill=1)
+        c.setStrokeColor(colors.grey)
+        c.setLineWidth(0.25)
+        c.grid(edges, [top - i * row_height for i in range(len(page_rows) + 2)])
+        c.setFillColor(colors.black)
+        for col in range(3):
+            # One clip region per column keeps long values out of the next cell
+            c.saveState()
+            clip = c.beginPath()
+            clip.rect(edges[col], bottom, edges[col + 1] - edges[col], top - bottom)
+            c.clipPath(clip, stroke=0, fill=0)
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(edges[col] + padding, top - row_height + 3, header[col])
+            text = c.beginText(edges[col] + padding, top - 2 * row_height + 3.5)
+            text.setFont("Helvetica", 8, leading=row_height)
+            for row in page_rows:
+                text.textLine(row[col])
+            c.drawText(text)
+            c.restoreState()
+
+    c = canvas.Canvas(str(path), pagesize=(page_width, page_height))
+    c.setTitle("SQL Compare Report")
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(margin, page_height - margin - 18, "SQL Compare Report")
+    top = page_height - margin - 36
+
+    pending = iter(sample)
+    while True:
+        per_page = int((top - margin) // row_height) - 1
+        page_rows = list(islice(pending, per_page))
+        if len(page_rows) < per_page:
+            page_rows += islice(rows, per_page - len(page_rows))
+        if not page_rows:
+            break
+        draw_page(top, page_rows)
+        c.showPage()
+        top = page_height - margin
+    c.save()
@@ -1,18 +1,276 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import mmap
+import os
 import re
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
+from utils.logger import get_logger
 
-def load_script_folder(root: str | Path) -> Dict[str, Any]:
+logger = get_logger(__name__)
+
+
+# CREATE header of an object in a script, matched on the raw bytes
+# so scripts without one are never decoded. Anchored to a line start (after
+# any indentation or a UTF-8 BOM) so "create" later in a line of a comment or
+# string literal is not taken for the header; headers inside /* */ comments
+# are skipped by _find_headers.
+_CREATE_OBJ_BODY = (
+    rb"\s*create\s+(?:or\s+alter\s+)?"
+    rb"(table|view|procedure|proc|function|trigger|synonym)\s+"
+    rb"(?P<fullname>[^\s(]+)"
+)
+_CREATE_OBJ_RE = re.compile(rb"^(?:\xef\xbb\xbf)?" + _CREATE_OBJ_BODY, re.IGNORECASE | re.MULTILINE)
+# The same header directly after the end of a block comment, e.g. "/* v2 */ CREATE VIEW ..."
+_CREATE_AFTER_COMMENT_RE = re.compile(_CREATE_OBJ_BODY, re.IGNORECASE)
+
+# GO batch separator line, with an optional repeat count ("GO 5") and
+# trailing comment, newline included
+_GO_RE = re.compile(rb"^[ \t]*go(?:[ \t]+\d+)?[ \t]*(?:--[^\r\n]*)?(?:\r?\n|\Z)", re.IGNORECASE | re.MULTILINE)
+
+# Outside a block comment: a line comment, a string literal, a [bracketed] or
+# "quoted" identifier, or a comment opener. All but the opener are consumed so
+# a "/*" or a quote inside them is ignored, e.g. [O'Brien].
+_CODE_TOKEN_RE = re.compile(rb"--[^\r\n]*|'[^']*(?:'|\Z)|\[[^\]]*(?:\]|\Z)|\"[^\"]*(?:\"|\Z)|/\*")
+# Inside a block comment; T-SQL block comments nest
+_COMMENT_TOKEN_RE = re.compile(rb"/\*|\*/")
+
+# Removes every bracket from quoted names such as [dbo].[Orders]
+_BRACKET_TBL = str.maketrans("", "", "[]")
+
+# Bumped when the cache table layout or the parsed objects change; older caches are rebuilt
+_CACHE_VERSION = 5
+
+# Threads reading scripts in load_script_folder; the work is mostly file I/O
+_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Header types that need not start their batch; each such header in a batch is an object
+_MULTI_PER_BATCH = frozenset({b"table", b"synonym"})
+
+# Header object type -> metadata bucket
+_TYPE_MAP = {
+    "table": "tables",
+    "view": "views",
+    "procedure": "procedures",
+    "proc": "procedures",
+    "function": "functions",
+    "trigger": "triggers",
+    "synonym": "synonyms",
+}
+
+
+def _iter_sql(root: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every .sql file under root.
+
+    An os.scandir walk reuses the type information from each directory
+    read instead of building and stat-ing a Path per entry as rglob does.
+    Directory symlinks and hidden directories (.git, .vs, ...) are not
+    followed.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        stack.append(entry.path)
+                # normcase keeps the Windows match case-insensitive, like rglob
+                elif os.path.normcase(entry.name).endswith(".sql") and entry.is_file():
+                    yield entry
+
+
+def _block_comments(buf) -> List[Tuple[int, int]]:
+    """Return the (start, end) offsets of each outermost /* */ comment in buf.
+
+    An unterminated comment runs to the end of buf.
+    """
+    spans = []
+    pos = 0
+    while True:
+        match = _CODE_TOKEN_RE.search(buf, pos)
+        if match is None:
+            return spans
+        pos = match.end()
+        if match.group() != b"/*":
+            continue
+        start, depth = match.start(), 1
+        while depth:
+            match = _COMMENT_TOKEN_RE.search(buf, pos)
+            if match is None:
+                spans.append((start, len(buf)))
+                return spans
+            pos = match.end()
+            depth += 1 if match.group() == b"/*" else -1
+        spans.append((start, pos))
+
+
+def _find_header(buf, pos: int, end: int, starts: List[int], ends: List[int]):
+    """Return the first CREATE header match in buf[pos:end] outside the comments.
+
+    starts and ends are the sorted offsets of the block comments in buf. A
+    header may begin a line or directly follow the end of a comment.
+    """
+    while True:
+        match = _CREATE_OBJ_RE.search(buf, pos, end)
+        if not starts:
+            return match
+        # Comments closing before the line-start match may be followed by a header
+        limit = end if match is None else match.start(1)
+        for comment_end in islice(ends, bisect.bisect_left(ends, pos), None):
+            if comment_end > limit:
+                break
+            after = _CREATE_AFTER_COMMENT_RE.match(buf, comment_end, end)
+            if after:
+                return after
+        if match is None:
+            return None
+        index = bisect.bisect_right(starts, match.start(1)) - 1
+        if index < 0 or match.start(1) >= ends[index]:
+            return match
+        # Resume after the comment holding this header
+        pos = ends[index]
+
+
+def _find_headers(buf) -> List[Tuple[int, bytes, bytes]]:
+    """Return (definition start, type, name) for each object CREATE header in buf.
+
+    A view, procedure, function or trigger must be the first statement of
+    its batch, so later headers in the same batch (e.g. CREATE TABLE #tmp
+    inside a procedure) belong to the object already found. Tables and
+    synonyms may share a batch, so after a table or synonym every further
+    table or synonym header in the batch is an object too. Temporary
+    (#name) tables and headers inside /* */ comments are ignored.
+
+    The first object of a batch starts at the batch, later ones at their
+    header line.
+    """
+    # Most scripts have no block comment, so the scan is skipped for them
+    comments = _block_comments(buf) if buf.find(b"/*") != -1 else []
+    starts = [start for start, _ in comments]
+    ends = [end for _, end in comments]
+    headers = []
+    start = 0
+    for sep in chain(_GO_RE.finditer(buf), (None,)):
+        end = len(buf) if sep is None else sep.start()
+        pos = start
+        first = True
+        while True:
+            match = _find_header(buf, pos, end, starts, ends)
+            if match is None:
+                break
+            pos = match.end()
+            obj_type, name = match.group(1, "fullname")
+            if name.lstrip(b"[").startswith(b"#"):
+                continue
+            multi = obj_type.lower() in _MULTI_PER_BATCH
+            if first:
+                headers.append((start, obj_type, name))
+                first = False
+                if not multi:
+                    break
+            elif multi:
+                # Begin at the header's line; \s* may have matched blank lines before it
+                newline = buf.rfind(b"\n", match.start(), match.start(1))
+                headers.append((match.start() if newline == -1 else newline + 1, obj_type, name))
+        if sep is not None:
+            start = sep.end()
+    return headers
+
+
+def _parse_one(sql_path: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Read one script and return (bucket, schema.name, entry) for each object it creates."""
+    with open(sql_path, "rb") as f:
+        # mmap rejects empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        # Search the mapped file so scripts without a header are never copied
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A header may also follow a comment on its line, so "*/" keeps the file
+            if not _CREATE_OBJ_RE.search(mm) and mm.find(b"*/") == -1:
+                return []
+            headers = _find_headers(mm)
+            if not headers:
+                return []
+            raw = mm[:]
+
+    # Decoded once from the bytes already read; non-UTF-8 scripts fall back to latin-1
+    encoding = "utf-8"
+    try:
+        sql_text = raw.decode(encoding)
+    except UnicodeDecodeError:
+        encoding = "latin-1"
+        sql_text = raw.decode(encoding, errors="ignore")
+
+    objects = []
+    # Each definition runs from its start to the next object's start; the
+    # first also keeps any preamble, so a single-object script is stored whole
+    bounds = [0, *(start for start, _, _ in headers[1:]), len(raw)]
+    for (_, type_bytes, name_bytes), begin, end in zip(headers, bounds, bounds[1:]):
+        obj_type = type_bytes.decode("ascii").lower()
+        fullname = name_bytes.decode(encoding, errors="ignore")
+
+        # Normalise object name to schema.name format
+        fullname = fullname.translate(_BRACKET_TBL)
+        if "." not in fullname:
+            fullname = "dbo." + fullname
+
+        definition = sql_text if len(headers) == 1 else raw[begin:end].decode(encoding, errors="ignore")
+        objects.append((_TYPE_MAP[obj_type], fullname, {"definition": definition}))
+    return objects
+
+
+def _open_cache(cache_path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the parsed-script cache database."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _CACHE_VERSION:
+        # One row per object, ordered by seq; a script that creates no
+        # object has a single row with a NULL bucket
+        conn.executescript(
+            "DROP TABLE IF EXISTS files;"
+            "CREATE TABLE files ("
+            "path TEXT, mtime INTEGER, size INTEGER, seq INTEGER, "
+            "bucket TEXT, fullname TEXT, definition TEXT, "
+            "PRIMARY KEY (path, seq));"
+            f"PRAGMA user_version = {_CACHE_VERSION};"
+        )
+    return conn
+
+
+def script_cache_path(root: str | Path, cache_dir: str | Path) -> Path:
+    """Return the parsed-script cache file in cache_dir for the scripts folder root.
+
+    Each folder gets its own file, named after a hash of its resolved path,
+    so the scripts folder itself is never written to.
+    """
+    key = os.path.normcase(str(Path(root).resolve())).encode("utf-8")
+    return Path(cache_dir) / f"scripts_{hashlib.sha1(key).hexdigest()[:16]}.sqlite"
+
+
+def load_script_folder(root: str | Path, cache_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load T-SQL scripts from a folder into a metadata dict.
 
     This provides a lightweight metadata representation compatible with
     the structures returned by MetadataExtractor.extract, focusing on
     object definitions (tables, views, procedures, functions, triggers,
     synonyms). Column-level details are not inferred; comparisons are
-    performed on raw definitions.
+    performed on raw definitions. A script may create several objects
+    in separate GO batches; each becomes its own entry.
+
+    When cache_path is given (see script_cache_path), parsed scripts are
+    cached in that SQLite file, keyed by path, modification time and size,
+    so unchanged files are not read again. Entries for scripts under root
+    that no longer exist are removed. Without a cache_path, or if the cache
+    cannot be read, every file is read.
     """
 
     base = Path(root)
@@ -28,44 +286,84 @@ def load_script_folder(root: str | Path) -> Dict[str, Any]:
         "synonyms": {},
     }
 
-    pattern = re.compile(
-        r"create\s+(or\s+alter\s+)?"
-        r"(table|view|procedure|proc|function|trigger|synonym)\s+"
-        r"(?P<fullname>[^\s(]+)",
-        re.IGNORECASE,
-    )
+    # Absolute paths, so cache keys do not depend on the working directory
+    root_path = str(base.resolve())
+    files = list(_iter_sql(root_path))
+    parsed: list = [()] * len(files)
+    misses = []  # (index, path, mtime, size) of files that must be read
 
-    for sql_file in base.rglob("*.sql"):
+    cache = None
+    if cache_path is not None:
         try:
-            sql_text = sql_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            sql_text = sql_file.read_text(encoding="latin-1", errors="ignore")
+            cache = _open_cache(cache_path)
+        except sqlite3.Error as e:
+            logger.warning(f"Script cache unavailable ({cache_path}): {e}")
 
-        match = pattern.search(sql_text)
-        if not match:
-            continue
+    try:
+        if cache is not None:
+            try:
+                for index, dir_entry in enumerate(files):
+                    key = dir_entry.path
+                    st = dir_entry.stat()
+                    cached = cache.execute(
+                        "SELECT bucket, fullname, definition FROM files WHERE path=? AND mtime=? AND size=? ORDER BY seq",
+                        (key, st.st_mtime_ns, st.st_size),
+                    ).fetchall()
+                    if not cached:
+                        misses.append((index, key, st.st_mtime_ns, st.st_size))
+                    else:
+                        parsed[index] = [
+                            (bucket, fullname, {"definition": definition})
+                            for bucket, fullname, definition in cached
+                            if bucket is not None
+                        ]
+            except sqlite3.Error as e:
+                # A locked or damaged cache only costs the speed-up
+                logger.warning(f"Script cache unreadable, reading every script ({cache_path}): {e}")
+                cache.close()
+                cache = None
+                parsed = [()] * len(files)
+                misses = []
+        if cache is None:
+            misses = [(index, dir_entry.path, None, None) for index, dir_entry in enumerate(files)]
 
-        obj_type = match.group(2).lower()
-        fullname = match.group("fullname").strip()
+        # Reads release the GIL, so scripts are loaded concurrently
+        rows = []
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            results = pool.map(_parse_one, (miss[1] for miss in misses))
+            for (index, key, mtime, size), objects in zip(misses, results):
+                parsed[index] = objects
+                for seq, (bucket, fullname, entry) in enumerate(objects or [(None, None, {"definition": None})]):
+                    rows.append((key, mtime, size, seq, bucket, fullname, entry["definition"]))
 
-        # Normalise object name to schema.name format
-        fullname = fullname.strip("[]")
-        if "." not in fullname:
-            fullname = f"dbo.{fullname}"
-
-        entry = {"definition": sql_text}
-
-        if obj_type == "table":
-            metadata.setdefault("tables", {})[fullname] = entry
-        elif obj_type == "view":
-            metadata.setdefault("views", {})[fullname] = entry
-        elif obj_type in ("procedure", "proc"):
-            metadata.setdefault("procedures", {})[fullname] = entry
-        elif obj_type == "function":
-            metadata.setdefault("functions", {})[fullname] = entry
-        elif obj_type == "trigger":
-            metadata.setdefault("triggers", {})[fullname] = entry
-        elif obj_type == "synonym":
-            metadata.setdefault("synonyms", {})[fullname] = entry
+        if cache is not None:
+            try:
+                # Scripts under root that the walk no longer finds were deleted or moved
+                prefix = os.path.join(root_path, "")
+                seen = {dir_entry.path for dir_entry in files}
+                stale = [
+                    (path,)
+                    for (path,) in cache.execute(
+                        "SELECT DISTINCT path FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+                    )
+                    if path not in seen
+                ]
+                if rows or stale:
+                    with cache:
+                        # Drop every row of a changed script; it may now create fewer objects
+                        cache.executemany("DELETE FROM files WHERE path=?", ((miss[1],) for miss in misses))
+                        cache.executemany("DELETE FROM files WHERE path=?", stale)
+                        cache.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not update script cache ({cache_path}): {e}")
+    finally:
+        if cache is not None:
+            cache.close()
+
+    # Merged in file order, so a later script still replaces an earlier one of the same name.
+    # Names are interned; the comparator and filters look them up repeatedly.
+    for objects in parsed:
+        for bucket, fullname, entry in objects:
+            metadata[bucket][sys.intern(fullname)] = entry
 
     return metadata
@@ -1,6 +1,8 @@
-import json
 import os
 import sys
+from functools import lru_cache
+
+import pytest
 
 # Ensure project root is on sys.path so "sql_compare_tool" package is importable
 CURRENT_DIR = os.path.dirname(__file__)
@@ -13,7 +15,8 @@ from sql_compare_tool.core.diff_generator import DiffGenerator
 from sql_compare_tool.core.script_generator import ScriptGenerator
 
 
-def test_schema_comparator_basic_statuses():
+@pytest.fixture(scope="module")
+def basic_tables():
     source = {
         "tables": {
             "dbo.Table1": {"columns": ["id"]},
@@ -26,10 +29,12 @@ def test_schema_comparator_basic_statuses():
             "dbo.TableOnlyInTarget": {"columns": []},
         }
     }
+    results = SchemaComparator(source, target).compare()
+    return {item["name"]: item for item in results["tables"]}
 
-    comp = SchemaComparator(source, target)
-    results = comp.compare()
-    tables = {item["name"]: item for item in results["tables"]}
+
+def test_schema_comparator_basic_statuses(basic_tables):
+    tables = basic_tables
 
     assert tables["dbo.Table1"]["status"] == "IDENTICAL"
     assert tables["dbo.TableOnlyInSource"]["status"] == "MISSING_IN_TARGET"
@@ -60,9 +65,10 @@ def test_diff_generator_side_by_side_tags():
     assert any(tag == "chg" for _l, _r, tag in diff)
 
 
-def test_script_generator_deploy_options_toggle_phases():
+@pytest.fixture(scope="module")
+def new_table_results():
     # Minimal comparison result that would normally trigger all phases
-    results = {
+    return {
         "tables": [
             {"name": "dbo.NewTable", "status": "MISSING_IN_TARGET", "details": {
                 "columns": [],
@@ -80,7 +86,11 @@ def test_script_generator_deploy_options_toggle_phases():
         "triggers": [],
         "synonyms": [],
     }
-    source_meta = {"tables": {"dbo.NewTable": {
+
+
+@pytest.fixture(scope="module")
+def new_table_source_meta():
+    return {"tables": {"dbo.NewTable": {
         "columns": [
             {"name": "id", "data_type": "int", "max_length": None, "precision": None, "scale": None, "is_nullable": False},
         ],
@@ -89,6 +99,8 @@ def test_script_generator_deploy_options_toggle_phases():
         "foreign_keys": []
     }}}
 
+
+def test_script_generator_deploy_options_toggle_phases(new_table_results, new_table_source_meta):
     # Disable drop and misc phases, and disable rollback
     opts = {
         "include_drop_phase": False,
@@ -96,7 +108,7 @@ def test_script_generator_deploy_options_toggle_phases():
         "include_rollback_section": False,
     }
 
-    script = ScriptGenerator(results, source_meta, "TestDb", deploy_options=opts).generate()
+    script = ScriptGenerator(new_table_results, new_table_source_meta, "TestDb", deploy_options=opts).generate()
 
     # Phase 1 and 5 headers should not appear
     assert "PHASE 1: DROP EXTRA OBJECTS" not in script
@@ -109,20 +121,24 @@ def test_script_generator_deploy_options_toggle_phases():
     assert "ROLLBACK SCRIPT (Generated)" not in script
 
 
-def test_script_generator_wrap_in_transaction_flag():
-    results = {"tables": []}
-    source_meta = {"tables": {}}
+@lru_cache(maxsize=None)
+def _empty_script(wrap: bool) -> str:
+    """Script for an empty comparison, generated once per wrap_in_transaction value."""
+    return ScriptGenerator({"tables": []}, {"tables": {}}, "Db1", deploy_options={"wrap_in_transaction": wrap}).generate()
 
-    script_tx = ScriptGenerator(results, source_meta, "Db1", deploy_options={"wrap_in_transaction": True}).generate()
-    script_no_tx = ScriptGenerator(results, source_meta, "Db1", deploy_options={"wrap_in_transaction": False}).generate()
 
-    # Deployment section should be wrapped in a transaction when flag is True
-    assert "BEGIN TRANSACTION;" in script_tx
-    assert "COMMIT TRANSACTION;" in script_tx
+@pytest.mark.parametrize("wrap", [True, False])
+def test_script_generator_wrap_in_transaction_flag(wrap):
+    script = _empty_script(wrap)
 
-    # For wrap_in_transaction=False, the main deployment section should not
-    # start a transaction, but the rollback section may still use one.
-    deploy_only = script_no_tx.split("-- ROLLBACK SCRIPT (Generated)")[0]
-    assert "BEGIN TRANSACTION;" not in deploy_only
-    assert "COMMIT TRANSACTION;" not in deploy_only
-    assert "no transaction wrapping" in deploy_only
+    if wrap:
+        # Deployment section should be wrapped in a transaction when flag is True
+        assert "BEGIN TRANSACTION;" in script
+        assert "COMMIT TRANSACTION;" in script
+    else:
+        # For wrap_in_transaction=False, the main deployment section should not
+        # start a transaction, but the rollback section may still use one.
+        deploy_only = script.split("-- ROLLBACK SCRIPT (Generated)")[0]
+        assert "BEGIN TRANSACTION;" not in deploy_only
+        assert "COMMIT TRANSACTION;" not in deploy_only
+        assert "no transaction wrapping" in deploy_only